@@ -1,77 +1,153 @@
 import datetime
 import json
 import queue
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import sys
 import re
 import os
+import subprocess
 import threading
+import time
 import tkinter as tk
 from pathlib import Path
-from tkinter import filedialog, messagebox, scrolledtext
+from tkinter import filedialog, messagebox
 from typing import Optional, Tuple
-from urllib.parse import ParseResult, parse_qs, urlparse
-import webbrowser
-import requests
-from PIL import Image, ImageTk
+from urllib.parse import ParseResult, unquote_plus, urlparse
+from PIL import Image
 import customtkinter as ctk
-import psutil
 
-# Import custom modules
+# Import custom modules; the downloader classes themselves are imported
+# lazily in their setup_* methods so startup does not pay for sites that are
+# never used in a session.
 from app.settings_window import SettingsWindow
 from app.about_window import AboutWindow
-from downloader.bunkr import BunkrDownloader
-from downloader.downloader import Downloader
-from downloader.erome import EromeDownloader
-from downloader.simpcity import SimpCity
-from downloader.phica import Phica
-from downloader.gofile import GofileDownloader
-from downloader.jpg5 import Jpg5Downloader
 from app.progress_manager import ProgressManager
 
 VERSION = "V0.8.5"
 MAX_LOG_LINES = 50  # Maximum number of log lines
 
+# Compiled once at import time so URL parsing does not pay the re-cache lookup on every call.
+_CK_PATH_RE = re.compile(r"/(?P<service>[^/?]+)(/user/(?P<user>[^/?]+)(/post/(?P<post>[^/?]+))?)?")
+
+# The r+ quantifier covers the bunkr/bunkrr/bunkrrr domain variants in one scan;
+# matched against the parsed hostname, not the raw URL.
+_BUNKR_HOST_RE = re.compile(r"(?:^|\.)bunkr+\.[a-z]{2,}$")
+_CK_HOSTS = frozenset({"coomer.su", "kemono.su"})
+
+# Extension sets used by the file reorganizer; stored without the leading dot
+# so the scan loop only lowercases the short suffix from rpartition('.').
+IMAGE_EXTS = frozenset({'png', 'jpg', 'jpeg', 'gif', 'bmp', 'webp', 'tiff', 'tif', 'svg', 'heic', 'raw'})
+VIDEO_EXTS = frozenset({'mp4', 'avi', 'mkv', 'mov', 'wmv', 'flv', 'webm', 'mpeg', 'mpg', 'm4v', '3gp', 'ogg'})
+
 def extract_ck_parameters(url: ParseResult) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     """
     Extracts the service, user, and post ID from the URL if they exist.
+
+    The common `/service[/user/X[/post/Y]]` shape is handled with a plain split,
+    which avoids firing up the regex engine per URL; anything else falls back to
+    the compiled pattern.
     """
-    match = re.search(r"/(?P<service>[^/?]+)(/user/(?P<user>[^/?]+)(/post/(?P<post>[^/?]+))?)?", url.path)
+    tokens = url.path.lstrip('/').split('/', 5)
+    service = tokens[0] if tokens and tokens[0] else None
+    user = post = None
+    try:
+        if service and len(tokens) >= 3 and tokens[1] == 'user':
+            user = tokens[2]
+            if len(tokens) >= 5 and tokens[3] == 'post':
+                post = tokens[4]
+        if service and (len(tokens) == 1 or user is not None):
+            return service, user, post
+    except IndexError:
+        pass
+
+    match = _CK_PATH_RE.search(url.path)
     if match:
-        site, service, post = match.group("service", "user", "post")
-        return site, service, post
+        return match.group("service", "user", "post")
     return None, None, None
 
 def extract_ck_query(url: ParseResult) -> Tuple[Optional[str], int]:
     """
     Attempts to extract the query and offset from the URL if they exist.
+
+    Scans the raw query string once instead of building a full parse_qs dict;
+    only the `q` and `o` parameters are ever used.
+    """
+    q = None
+    offset = 0
+    if url.query:
+        for part in url.query.split('&'):
+            if part.startswith('q='):
+                q = unquote_plus(part[2:])
+            elif part.startswith('o='):
+                value = part[2:]
+                if value.isdigit():
+                    offset = int(value)
+    return q, offset
+
+def extract_ck(url: ParseResult) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str], int]:
+    """
+    Extracts (service, user, post, query, offset) from a single parsed URL so
+    callers that need both halves only parse the URL once.
     """
-    query = parse_qs(url.query)
-    q = query.get("q", [None])[0]
-    o = query.get("o", ["0"])[0]
-    return q, int(o) if o.isdigit() else 0
+    service, user, post = extract_ck_parameters(url)
+    q, offset = extract_ck_query(url)
+    return service, user, post, q, offset
+
+@lru_cache(maxsize=64)
+def _load_image(path: str, size: Tuple[int, int]) -> ctk.CTkImage:
+    """
+    Decodes and resizes an image once per (path, size); cached for the life of
+    the process so menu rebuilds never re-read or re-decode the file.
+    """
+    return ctk.CTkImage(Image.open(path), size=size)
 
 class ImageDownloaderApp(ctk.CTk):
+    # Menu-bar icons as (name, image path, label, link); drives both icon
+    # loading in __init__ and menu construction.
+    _MENU_ICONS = (
+        ("github", "resources/img/github-logo-24.png", "GitHub", "https://github.com/emy69/CoomerDL"),
+        ("discord", "resources/img/discord-alt-logo-24.png", "Discord", "https://discord.gg/ku8gSPsesh"),
+        ("support", "resources/img/dollar-circle-solid-24.png", "Support", "https://buymeacoffee.com/emy_69"),
+    )
+
     def __init__(self):
         super().__init__()
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("dark-blue")
         self.errors = []
         self.warnings = []
+        self._log_buffer = deque()
+        self._log_lock = threading.Lock()
+        self._log_flush_scheduled = False
+        self._log_line_count = 0
         self.title(f"Downloader [{VERSION}]")
         
         # Initialize attributes
         self.settings_window = SettingsWindow(self, self.tr, self.load_translations, self.update_ui_texts, self.save_language_preference, VERSION, self)
         self.about_window = AboutWindow(self, self.tr, VERSION)
         self.settings = self.settings_window.load_settings()
+        self._tr_cache = {}
+        self._all_translations = None
+        self._lang_cache = {}
+        self._current_lang = None
         lang = self.load_language_preference()
         self.load_translations(lang)
         self.image_downloader = None
         self.progress_bars = {}
-        self.github_icon = self.load_icon("resources/img/github-logo-24.png", "GitHub", size=(16, 16))
-        self.discord_icon = self.load_icon("resources/img/discord-alt-logo-24.png", "Discord", size=(16, 16))
-        self.new_icon = self.load_icon("resources/img/dollar-circle-solid-24.png", "New Icon", size=(16, 16))
+        self._menu_ignore_cache = None
+        self.menu_icons = {
+            name: self.load_icon(path, label, size=(16, 16))
+            for name, path, label, _ in self._MENU_ICONS
+        }
         self.download_folder = self.load_download_folder()
+        self._folder_valid = False
+        self._folder_valid_at = 0.0
         self.active_downloader = None
+        self._downloaders = []
+        # One long-lived orchestration worker instead of a fresh thread per download
+        self._download_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dl-orch")
         self.max_downloads = self.settings_window.settings.get('max_downloads', 3)
 
         self.icons = {
@@ -86,9 +162,9 @@ class ImageDownloaderApp(ctk.CTk):
         self.initialize_ui()
         self.update_ui_texts()
         
-        # Configure update queue
+        # Configure update queue; drained on demand instead of by periodic polling
         self.update_queue = queue.Queue()
-        self.check_update_queue()
+        self._update_scheduled = False
         
         # Configure close events
         self.protocol("WM_DELETE_WINDOW", self.on_app_close)
@@ -144,14 +220,15 @@ class ImageDownloaderApp(ctk.CTk):
         """
         Adds custom buttons and icons to the menu bar.
         """
-        # Main menu buttons
+        # Main menu buttons, remembered as (widget, english_key) pairs so
+        # update_ui_texts can retranslate them without probing cget("text").
+        self._localizable_menu_buttons = []
         self.add_menu_button("File", self.toggle_archivo_menu)
         self.add_menu_button("About", self.about_window.show_about)
         
         # Add custom icons
-        self.add_icon_to_menu(self.github_icon, "GitHub", "https://github.com/emy69/CoomerDL")
-        self.add_icon_to_menu(self.discord_icon, "Discord", "https://discord.gg/ku8gSPsesh")
-        self.add_icon_to_menu(self.new_icon, "Support", "https://buymeacoffee.com/emy_69")
+        for name, _, label, link in self._MENU_ICONS:
+            self.add_icon_to_menu(self.menu_icons[name], label, link)
         
         # Initialize variables for dropdown menus
         self.archivo_menu_frame = None
@@ -172,6 +249,7 @@ class ImageDownloaderApp(ctk.CTk):
         )
         button.pack(side="left")
         button.bind("<Button-1>", lambda e: "break")
+        self._localizable_menu_buttons.append((button, text))
     
     def add_icon_to_menu(self, icon: Optional[ctk.CTkImage], text: str, link: str):
         """
@@ -187,12 +265,26 @@ class ImageDownloaderApp(ctk.CTk):
                 compound="left"
             )
             label.pack(padx=5, pady=5)
-            frame.bind("<Enter>", lambda e: frame.configure(fg_color="gray25"))
-            frame.bind("<Leave>", lambda e: frame.configure(fg_color="transparent"))
-            label.bind("<Enter>", lambda e: frame.configure(fg_color="gray25"))
-            label.bind("<Leave>", lambda e: frame.configure(fg_color="transparent"))
-            label.bind("<Button-1>", lambda e: webbrowser.open(link))
+            # One shared handler pair per icon instead of four lambdas
+            def on_enter(event, target=frame):
+                target.configure(fg_color="gray25")
+
+            def on_leave(event, target=frame):
+                target.configure(fg_color="transparent")
+
+            for widget in (frame, label):
+                widget.bind("<Enter>", on_enter)
+                widget.bind("<Leave>", on_leave)
+            label.bind("<Button-1>", lambda e: self._open_link(link))
     
+    def _open_link(self, link: str):
+        """
+        Opens a link in the default browser; webbrowser is imported lazily so
+        app startup does not pay for it.
+        """
+        import webbrowser
+        webbrowser.open(link)
+
     def create_input_frame(self):
         """
         Creates the input frame for the URL and download folder.
@@ -261,7 +353,16 @@ class ImageDownloaderApp(ctk.CTk):
         # Add the new button for reorganizing files
         self.reorganize_button = ctk.CTkButton(self.action_frame, text=self.tr("Reorganize Files"), command=self.reorganize_files)
         self.reorganize_button.pack(side='left', padx=10)
-        
+
+        # Info icon next to the checkbox; created once so toggling is a pure text change
+        info_icon = self.load_and_resize_image('resources/img/info_icon.png', (16, 16))
+        self.info_label = ctk.CTkLabel(self.action_frame, image=info_icon, text="", cursor="hand2")
+        self.info_label.pack(side='left', padx=5)
+        self.create_tooltip(self.info_label, self.tr(
+            "Select this option to download all available content from the profile,\n"
+            "instead of only the posts from the provided URL."
+        ))
+
         self.update_info_text()
     
     def reorganize_files(self):
@@ -277,58 +378,72 @@ class ImageDownloaderApp(ctk.CTk):
         if not main_folder:
             # User canceled the folder selection
             return
-        
+
+        # Run the actual file I/O on a worker thread so the Tk main loop stays responsive
+        self.reorganize_button.configure(state="disabled")
+        threading.Thread(target=self._do_reorganize, args=(main_folder,), daemon=True).start()
+
+    def _do_reorganize(self, main_folder: str):
+        """
+        Worker-thread body of the reorganization; logs via add_log_message_safe.
+        """
         # Create 'IMAGES' and 'VIDEOS' folders inside the main folder
         images_folder = os.path.join(main_folder, "IMAGES")
         videos_folder = os.path.join(main_folder, "VIDEOS")
         os.makedirs(images_folder, exist_ok=True)
         os.makedirs(videos_folder, exist_ok=True)
         
-        # Define image and video file extensions
-        image_extensions = ('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp', '.tiff', '.tif', '.svg', '.heic', '.raw')
-        video_extensions = ('.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.mpeg', '.mpg', '.m4v', '.3gp', '.ogg')
-        
-        # Walk through the main folder and move files
-        for root, dirs, files in os.walk(main_folder):
+        # Walk the main folder with scandir (DirEntry caches stat info) and move files
+        visited_dirs = []
+        stack = [main_folder]
+        while stack:
+            current = stack.pop()
             # Skip the 'IMAGES' and 'VIDEOS' folders to avoid moving files twice
-            if root == images_folder or root == videos_folder:
+            if current == images_folder or current == videos_folder:
                 continue
-            
-            for file in files:
-                file_path = os.path.join(root, file)
-                if file.lower().endswith(image_extensions):
-                    # Move image files to the 'IMAGES' folder
-                    new_path = os.path.join(images_folder, file)
-                elif file.lower().endswith(video_extensions):
-                    # Move video files to the 'VIDEOS' folder
-                    new_path = os.path.join(videos_folder, file)
-                else:
-                    # Skip other file types
-                    continue
-                
-                # Move the file
-                try:
-                    os.rename(file_path, new_path)
-                    self.add_log_message_safe(f"Moved {file} to {os.path.basename(new_path)} folder.")
-                except Exception as e:
-                    self.add_log_message_safe(f"Error moving {file}: {e}")
-        
-        # Delete empty subfolders
-        for root, dirs, files in os.walk(main_folder, topdown=False):
-            # Skip the 'IMAGES' and 'VIDEOS' folders
-            if root == images_folder or root == videos_folder:
+            visited_dirs.append(current)
+            try:
+                entries = os.scandir(current)
+            except OSError as e:
+                self.add_log_message_safe(f"Error scanning folder {current}: {e}")
                 continue
-            
-            for dir in dirs:
-                dir_path = os.path.join(root, dir)
-                try:
-                    if not os.listdir(dir_path):
-                        os.rmdir(dir_path)
-                        self.add_log_message_safe(f"Deleted empty folder: {dir_path}")
-                except Exception as e:
-                    self.add_log_message_safe(f"Error deleting folder {dir_path}: {e}")
-        
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    _, sep, ext = entry.name.rpartition('.')
+                    ext = ext.lower() if sep else ''
+                    if ext in IMAGE_EXTS:
+                        new_path = os.path.join(images_folder, entry.name)
+                    elif ext in VIDEO_EXTS:
+                        new_path = os.path.join(videos_folder, entry.name)
+                    else:
+                        # Skip other file types
+                        continue
+
+                    # Move the file (os.replace is atomic on the same filesystem)
+                    try:
+                        os.replace(entry.path, new_path)
+                        self.add_log_message_safe(f"Moved {entry.name} to {os.path.basename(new_path)} folder.")
+                    except Exception as e:
+                        self.add_log_message_safe(f"Error moving {entry.name}: {e}")
+
+        # Delete empty subfolders, deepest first
+        for dir_path in reversed(visited_dirs):
+            if dir_path == main_folder:
+                continue
+            try:
+                if not os.listdir(dir_path):
+                    os.rmdir(dir_path)
+                    self.add_log_message_safe(f"Deleted empty folder: {dir_path}")
+            except Exception as e:
+                self.add_log_message_safe(f"Error deleting folder {dir_path}: {e}")
+
         self.add_log_message_safe(self.tr("File reorganization completed."))
+        self.after(0, lambda: self.reorganize_button.configure(state="normal"))
     
     def create_log_textbox(self):
         """
@@ -391,12 +506,9 @@ class ImageDownloaderApp(ctk.CTk):
         """
         Updates the UI texts based on the selected language.
         """
-        # Update menu button texts
-        for widget in self.menu_bar.winfo_children():
-            if isinstance(widget, ctk.CTkButton):
-                text = widget.cget("text").strip()
-                if text in ["File", "About", "Donations"]:
-                    widget.configure(text=self.tr(text))
+        # Update menu button texts from the static (widget, key) table
+        for widget, key in self._localizable_menu_buttons:
+            widget.configure(text=self.tr(key))
         
         # Update other texts
         self.url_label.configure(text=self.tr("Website URL:"))
@@ -423,6 +535,7 @@ class ImageDownloaderApp(ctk.CTk):
         """
         if self.archivo_menu_frame and self.archivo_menu_frame.winfo_exists():
             self.archivo_menu_frame.destroy()
+            self._menu_ignore_cache = None
         else:
             self.close_all_menus()
             self.archivo_menu_frame = self.create_menu_frame([
@@ -470,13 +583,13 @@ class ImageDownloaderApp(ctk.CTk):
         for menu_frame in [self.archivo_menu_frame, self.ayuda_menu_frame, self.donaciones_menu_frame]:
             if menu_frame and menu_frame.winfo_exists():
                 menu_frame.destroy()
+        self._menu_ignore_cache = None
     
     def load_and_resize_image(self, path: str, size: Tuple[int, int]) -> ctk.CTkImage:
         """
-        Loads and resizes an image.
+        Loads and resizes an image through the module-level lru_cache.
         """
-        img = Image.open(path)
-        return ctk.CTkImage(img, size=size)
+        return _load_image(path, size)
     
     def load_icon(self, icon_path: str, icon_name: str, size: Tuple[int, int] = (16, 16)) -> Optional[ctk.CTkImage]:
         """
@@ -498,6 +611,7 @@ class ImageDownloaderApp(ctk.CTk):
                 self.tr("There is an active download. Please cancel the download before closing.")
             )
         else:
+            self._download_executor.shutdown(wait=False)
             self.destroy()
     
     def is_download_active(self) -> bool:
@@ -509,17 +623,24 @@ class ImageDownloaderApp(ctk.CTk):
     def close_program(self):
         """
         Closes all windows and terminates the main process.
+
+        Signals any active download to stop, then exits immediately with
+        os._exit instead of enumerating child processes through psutil.
         """
+        if self.active_downloader is not None:
+            self.active_downloader.cancel_requested = True
         self.destroy()
-        current_process = psutil.Process(os.getpid())
-        for handler in current_process.children(recursive=True):
-            handler.kill()
-        current_process.kill()
+        os._exit(0)
     
     def save_language_preference(self, language_code: str):
         """
         Saves the language preference.
+
+        Re-selecting the current language is a no-op, skipping both the disk
+        write and the UI text rebuild.
         """
+        if language_code == self._current_lang:
+            return
         config = {'language': language_code}
         with open('resources/config/languages/save_language/language_config.json', 'w', encoding='utf-8') as config_file:
             json.dump(config, config_file)
@@ -537,49 +658,83 @@ class ImageDownloaderApp(ctk.CTk):
         except FileNotFoundError:
             return 'en'
     
-    def load_translations(self, lang: str):
+    _TRANSLATIONS_PATH = "resources/config/languages/translations.json"
+    _TRANSLATIONS_CACHE_DIR = Path("resources/config/languages/cache")
+
+    def _get_lang(self, lang: str) -> dict:
         """
-        Loads translations for the selected language.
+        Returns the flat {key: value} mapping for a language.
+
+        A pre-pivoted translations.<lang>.json sidecar is read when it is newer
+        than the master file, so startup only parses the selected language;
+        otherwise the master is pivoted once and the sidecar regenerated.
         """
-        path = "resources/config/languages/translations.json"
-        with open(path, 'r', encoding='utf-8') as file:
-            all_translations = json.load(file)
-            self.translations = {key: value.get(lang, key) for key, value in all_translations.items()}
-    
-    def tr(self, text: str, **kwargs) -> str:
+        translations = self._lang_cache.get(lang)
+        if translations is not None:
+            return translations
+
+        cache_path = self._TRANSLATIONS_CACHE_DIR / f"translations.{lang}.json"
+        try:
+            if cache_path.stat().st_mtime >= os.path.getmtime(self._TRANSLATIONS_PATH):
+                translations = json.loads(cache_path.read_text(encoding='utf-8'))
+        except (OSError, json.JSONDecodeError):
+            translations = None
+
+        if translations is None:
+            if self._all_translations is None:
+                with open(self._TRANSLATIONS_PATH, 'r', encoding='utf-8') as file:
+                    self._all_translations = json.load(file)
+            translations = {key: value.get(lang, key) for key, value in self._all_translations.items()}
+            try:
+                self._TRANSLATIONS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+                tmp_path.write_text(json.dumps(translations, ensure_ascii=False), encoding='utf-8')
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                pass  # The sidecar is only an optimization; keep going without it
+
+        self._lang_cache[lang] = translations
+        return translations
+
+    def load_translations(self, lang: str):
         """
-        Returns the translated text.
+        Loads translations for the selected language.
+
+        The master file is parsed at most once; switching back to a language
+        already seen is a plain dict assignment.
         """
-        translated_text = self.translations.get(text, text)
-        if kwargs:
-            translated_text = translated_text.format(**kwargs)
-        return translated_text
+        self.translations = self._get_lang(lang)
+        self._current_lang = lang
+        self._tr_cache.clear()
+        # Constant-fold the strings toggled by the "download all" checkbox
+        self._txt_download_entire = self.tr("Download entire profile")
+        self._txt_download_only = self.tr("Download only posts from the provided URL")
     
     def select_folder(self):
         """
         Opens a dialog to select the download folder.
         """
         folder_selected = filedialog.askdirectory()
-        if folder_selected:
+        if folder_selected and folder_selected != self.download_folder:
             self.download_folder = folder_selected
+            self._folder_valid_at = 0.0  # invalidate the cached isdir check
             self.folder_path.configure(text=folder_selected)
             self.save_download_folder(folder_selected)
     
     def load_download_folder(self) -> Optional[str]:
         """
         Loads the download folder from the configuration.
+
+        The common case is a single read; the directory and default file are
+        only created when the config is missing or corrupt.
         """
-        config_path = 'resources/config/download_path/download_folder.json'
-        config_dir = Path(config_path).parent
-        config_dir.mkdir(parents=True, exist_ok=True)
-        if not Path(config_path).exists():
-            with open(config_path, 'w', encoding='utf-8') as config_file:
-                json.dump({'download_folder': ''}, config_file)
+        config_path = Path('resources/config/download_path/download_folder.json')
         try:
-            with open(config_path, 'r', encoding='utf-8') as config_file:
-                config = json.load(config_file)
-                return config.get('download_folder', '')
-        except json.JSONDecodeError:
+            config = json.loads(config_path.read_text(encoding='utf-8'))
+            return config.get('download_folder', '')
+        except (FileNotFoundError, json.JSONDecodeError):
+            config_path.parent.mkdir(parents=True, exist_ok=True)
+            config_path.write_text(json.dumps({'download_folder': ''}), encoding='utf-8')
             return ''
     
     def save_download_folder(self, folder_path: str):
@@ -590,40 +745,13 @@ class ImageDownloaderApp(ctk.CTk):
         with open('resources/config/download_path/download_folder.json', 'w', encoding='utf-8') as config_file:
             json.dump(config, config_file)
     
-    def load_github_icon(self) -> Optional[ctk.CTkImage]:
-        """
-        Loads the GitHub icon.
-        """
-        return self.load_icon("resources/img/github-logo-24.png", "GitHub")
-    
-    def load_discord_icon(self) -> Optional[ctk.CTkImage]:
-        """
-        Loads the Discord icon.
-        """
-        return self.load_icon("resources/img/discord-alt-logo-24.png", "Discord")
-    
-    def load_new_icon(self) -> Optional[ctk.CTkImage]:
-        """
-        Loads the new support icon.
-        """
-        return self.load_icon("resources/img/dollar-circle-solid-24.png", "New Icon")
-    
     def update_info_text(self):
         """
-        Updates the text of the download all checkbox.
+        Updates the text of the download all checkbox using the strings
+        precomputed at language-load time.
         """
-        text = self.tr("Download entire profile") if self.download_all_check.get() else self.tr("Download only posts from the provided URL")
+        text = self._txt_download_entire if self.download_all_check.get() else self._txt_download_only
         self.download_all_check.configure(text=text)
-        
-        # Add info icon if it doesn't exist
-        if not hasattr(self, 'info_label'):
-            info_icon = self.load_and_resize_image('resources/img/info_icon.png', (16, 16))
-            self.info_label = ctk.CTkLabel(self.action_frame, image=info_icon, text="", cursor="hand2")
-            self.info_label.pack(side='left', padx=5)
-            self.create_tooltip(self.info_label, self.tr(
-                "Select this option to download all available content from the profile,\n"
-                "instead of only the posts from the provided URL."
-            ))
     
     def create_tooltip(self, widget: tk.Widget, text: str):
         """
@@ -665,38 +793,63 @@ class ImageDownloaderApp(ctk.CTk):
     def add_log_message_safe(self, message: str):
         """
         Adds a log message safely from threads.
+
+        Messages are buffered and flushed to the textbox in one batched insert,
+        so heavy logging schedules a single Tk callback instead of one per line.
         """
         if "error" in message.lower():
             self.errors.append(message)
         if "warning" in message.lower():
             self.warnings.append(message)
-        
-        def log_in_main_thread():
-            self.log_textbox.configure(state='normal')
-            self.log_textbox.insert('end', message + '\n')
-            self.limit_log_lines()
-            self.log_textbox.configure(state='disabled')
-            self.log_textbox.yview_moveto(1)
-        
-        self.after(0, log_in_main_thread)
+
+        with self._log_lock:
+            self._log_buffer.append(message)
+            schedule_flush = not self._log_flush_scheduled
+            if schedule_flush:
+                self._log_flush_scheduled = True
+        if schedule_flush:
+            self.after_idle(self._flush_log)
+
+    def _flush_log(self):
+        """
+        Drains the pending log buffer into the textbox in a single insert.
+        """
+        with self._log_lock:
+            self._log_flush_scheduled = False
+            if not self._log_buffer:
+                return
+            lines = list(self._log_buffer)
+            self._log_buffer.clear()
+
+        self.log_textbox.configure(state='normal')
+        self.log_textbox.insert('end', '\n'.join(lines) + '\n')
+        # Batched producers deliver multi-line messages, so count the actual
+        # textbox lines added rather than the number of messages
+        self._log_line_count += sum(msg.count('\n') + 1 for msg in lines)
+        self.limit_log_lines()
+        self.log_textbox.configure(state='disabled')
+        self.log_textbox.yview_moveto(1)
     
     def limit_log_lines(self):
         """
         Limits the number of lines in the log textbox.
+
+        Uses the incrementally maintained line counter, avoiding a full
+        get/split of the textbox contents on every flush.
         """
-        log_lines = self.log_textbox.get("1.0", "end-1c").split("\n")
-        if len(log_lines) > MAX_LOG_LINES:
-            self.log_textbox.configure(state='normal')
-            self.log_textbox.delete("1.0", f"{len(log_lines) - MAX_LOG_LINES}.0")
-            self.log_textbox.configure(state='disabled')
+        overflow = self._log_line_count - MAX_LOG_LINES
+        if overflow > 0:
+            self.log_textbox.delete("1.0", f"{overflow + 1}.0")
+            self._log_line_count -= overflow
     
     def export_logs(self):
         """
         Exports logs to a file.
+
+        Runs on the Tk thread: builds the summary, snapshots the textbox, then
+        hands the actual file write to a background thread so re-enabling the
+        UI is never gated on disk I/O.
         """
-        log_folder = "resources/config/logs/"
-        Path(log_folder).mkdir(parents=True, exist_ok=True)
-        log_file_path = Path(log_folder) / f"log_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
         try:
             total_files = self.active_downloader.total_files if self.active_downloader else 0
             completed_files = self.active_downloader.completed_files if self.active_downloader else 0
@@ -723,27 +876,49 @@ class ImageDownloaderApp(ctk.CTk):
                 f"{self.tr('Failed files')}:\n{failed_files_summary}\n\n"
             )
             
-            with open(log_file_path, 'w', encoding='utf-8') as file:
+            # dump() yields the Text widget's internal text fragments directly,
+            # avoiding the giant single Tcl-string conversion that get() makes.
+            # CTkTextbox does not forward dump, so go through the wrapped Text.
+            textbox = getattr(self.log_textbox, '_textbox', self.log_textbox)
+            chunks = [value for _key, value, _index in textbox.dump("1.0", tk.END, text=True)]
+            threading.Thread(target=self._write_log_file, args=(summary, chunks), daemon=True).start()
+        except Exception as e:
+            self.add_log_message_safe(self.tr("Failed to export logs: {e}", e=e))
+
+    def _write_log_file(self, summary: str, chunks: list):
+        """
+        Background-thread body of the log export; touches no Tk state.
+        """
+        log_folder = "resources/config/logs/"
+        Path(log_folder).mkdir(parents=True, exist_ok=True)
+        log_file_path = Path(log_folder) / f"log_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+        try:
+            with open(log_file_path, 'w', encoding='utf-8', buffering=1 << 18) as file:
                 file.write(summary)
-                file.write(self.log_textbox.get("1.0", tk.END))
+                for chunk in chunks:
+                    file.write(chunk)
             self.add_log_message_safe(self.tr("Logs successfully exported to {path}", path=log_file_path))
         except Exception as e:
             self.add_log_message_safe(self.tr("Failed to export logs: {e}", e=e))
     
+    def _url_entry_widget(self) -> tk.Entry:
+        """
+        Returns the underlying tk.Entry; CTkEntry does not forward
+        selection_present, which the clipboard handlers use as a cheap
+        predicate instead of catching TclError.
+        """
+        return getattr(self.url_entry, '_entry', self.url_entry)
+
     def copy_to_clipboard(self):
         """
         Copies the selected text to the clipboard.
         """
-        try:
-            selected_text = self.url_entry.selection_get()
-            if selected_text:
-                self.clipboard_clear()
-                self.clipboard_append(selected_text)
-            else:
-                self.add_log_message_safe(self.tr("No text selected to copy."))
-        except tk.TclError:
+        if self._url_entry_widget().selection_present():
+            self.clipboard_clear()
+            self.clipboard_append(self.url_entry.selection_get())
+        else:
             self.add_log_message_safe(self.tr("No text selected to copy."))
-    
+
     def paste_from_clipboard(self):
         """
         Pastes text from the clipboard into the URL entry.
@@ -751,29 +926,23 @@ class ImageDownloaderApp(ctk.CTk):
         try:
             clipboard_text = self.clipboard_get()
             if clipboard_text:
-                try:
+                if self._url_entry_widget().selection_present():
                     self.url_entry.delete("sel.first", "sel.last")
-                except tk.TclError:
-                    pass
                 self.url_entry.insert(tk.INSERT, clipboard_text)
             else:
                 self.add_log_message_safe(self.tr("No text in clipboard to paste."))
         except tk.TclError as e:
             self.add_log_message_safe(self.tr(f"Error pasting from clipboard: {e}"))
-    
+
     def cut_to_clipboard(self):
         """
         Cuts the selected text and copies it to the clipboard.
         """
-        try:
-            selected_text = self.url_entry.selection_get()
-            if selected_text:
-                self.clipboard_clear()
-                self.clipboard_append(selected_text)
-                self.url_entry.delete("sel.first", "sel.last")
-            else:
-                self.add_log_message_safe(self.tr("No text selected to cut."))
-        except tk.TclError:
+        if self._url_entry_widget().selection_present():
+            self.clipboard_clear()
+            self.clipboard_append(self.url_entry.selection_get())
+            self.url_entry.delete("sel.first", "sel.last")
+        else:
             self.add_log_message_safe(self.tr("No text selected to cut."))
     
     def show_context_menu(self, event):
@@ -782,32 +951,28 @@ class ImageDownloaderApp(ctk.CTk):
         """
         self.context_menu.tk_popup(event.x_root, event.y_root)
         self.context_menu.grab_release()
-    
-    def check_update_queue(self):
-        """
-        Checks and executes tasks in the update queue.
-        """
-        while not self.update_queue.empty():
-            task = self.update_queue.get_nowait()
-            task()
-        self.after(100, self.check_update_queue)
-    
-    def enable_widgets(self):
+
+    def _register_downloader(self, old, new):
         """
-        Enables widgets after an operation.
+        Tracks a live downloader, dropping the cancelled instance it replaces.
         """
-        self.update_queue.put(lambda: self.download_button.configure(state="normal"))
-        self.update_queue.put(lambda: self.cancel_button.configure(state="disabled"))
-        self.update_queue.put(lambda: self.download_all_check.configure(state="normal"))
-    
+        if old is not None:
+            try:
+                self._downloaders.remove(old)
+            except ValueError:
+                pass
+        self._downloaders.append(new)
+
     def update_max_downloads(self, max_downloads: int):
         """
         Updates the maximum number of simultaneous downloads.
+
+        Every constructed downloader registers itself in _downloaders, so this
+        reaches all of them without probing attribute names.
         """
         self.max_downloads = max_downloads
-        for downloader in [getattr(self, attr, None) for attr in ['general_downloader', 'erome_downloader', 'bunkr_downloader']]:
-            if downloader:
-                downloader.max_workers = max_downloads
+        for downloader in self._downloaders:
+            downloader.max_workers = max_downloads
     
     def on_hover_enter(self, event):
         """
@@ -824,8 +989,15 @@ class ImageDownloaderApp(ctk.CTk):
     def open_download_folder(self, event=None):
         """
         Opens the download folder in the file explorer.
-        """
-        if self.download_folder and os.path.exists(self.download_folder):
+
+        The isdir result is cached for a couple of seconds so rapid repeat
+        clicks do not stat again (stat can block for seconds on network shares).
+        """
+        now = time.monotonic()
+        if now - self._folder_valid_at >= 2.0:
+            self._folder_valid = bool(self.download_folder) and os.path.isdir(self.download_folder)
+            self._folder_valid_at = now
+        if self._folder_valid:
             try:
                 if sys.platform == "win32":
                     os.startfile(self.download_folder)
@@ -838,62 +1010,6 @@ class ImageDownloaderApp(ctk.CTk):
         else:
             messagebox.showerror(self.tr("Error"), self.tr("The folder does not exist or is invalid."))
     
-    def on_click(self, event):
-        """
-        Closes dropdown menus if clicked outside of them.
-        """
-        widgets_to_ignore = [self.menu_bar]
-        for frame in [self.archivo_menu_frame, self.ayuda_menu_frame, self.donaciones_menu_frame]:
-            if frame and frame.winfo_exists():
-                widgets_to_ignore.append(frame)
-                widgets_to_ignore.extend(self.get_all_children(frame))
-        if event.widget not in widgets_to_ignore:
-            self.close_all_menus()
-    
-    def get_all_children(self, widget: tk.Widget) -> list:
-        """
-        Recursively gets all children of a widget.
-        """
-        children = widget.winfo_children()
-        all_children = list(children)
-        for child in children:
-            all_children.extend(self.get_all_children(child))
-        return all_children
-    
-    def start_download(self):
-        """
-        Starts the download process based on the provided URL.
-        """
-        url = self.url_entry.get().strip()
-        if not self.download_folder:
-            messagebox.showerror(self.tr("Error"), self.tr("Please select a download folder."))
-            return
-        
-        self.download_button.configure(state="disabled")
-        self.cancel_button.configure(state="normal")
-        self.download_start_time = datetime.datetime.now()
-        self.errors = []
-        download_all = self.download_all_check.get()
-        
-        parsed_url = urlparse(url)
-        
-        if "erome.com" in url:
-            self.handle_erome_download(url)
-        elif re.search(r"https?://([a-z0-9-]+\.)?bunkr\.[a-z]{2,}", url):
-            self.handle_bunkr_download(url)
-        elif parsed_url.netloc in ["coomer.su", "kemono.su"]:
-            self.handle_general_download(parsed_url, download_all)
-        elif "phica.eu" in url:  # Add this condition for Phica
-            self.handle_phica_download(url)
-        elif "simpcity.su" in url:
-            self.handle_simpcity_download(url)
-        elif "jpg5.su" in url:
-            self.handle_jpg5_download()
-        else:
-            self.add_log_message_safe(self.tr("Invalid URL"))
-            self.download_button.configure(state="normal")
-            self.cancel_button.configure(state="disabled")
-
     def handle_phica_download(self, url: str):
         """
         Handles downloading from Phica.
@@ -907,8 +1023,16 @@ class ImageDownloaderApp(ctk.CTk):
 
     def setup_phica_downloader(self):
         """
-        Configures the Phica downloader.
+        Configures the Phica downloader, reusing the previous instance (and its
+        logged-in scraper session) when possible.
         """
+        downloader = getattr(self, 'phica_downloader', None)
+        if downloader is not None and not downloader.cancel_requested:
+            downloader.download_folder = self.download_folder
+            downloader.total_files = 0
+            downloader.completed_files = 0
+            return
+        from downloader.phica import Phica
         self.phica_downloader = Phica(
             download_folder=self.download_folder,
             log_callback=self.add_log_message_safe,
@@ -917,6 +1041,7 @@ class ImageDownloaderApp(ctk.CTk):
             update_global_progress_callback=self.update_global_progress,
             tr=self.tr
         )
+        self._register_downloader(downloader, self.phica_downloader)
 
     def handle_gofile_download(self, url: str):
         """
@@ -931,8 +1056,16 @@ class ImageDownloaderApp(ctk.CTk):
 
     def setup_gofile_downloader(self):
         """
-        Configures the Gofile downloader.
+        Configures the Gofile downloader, reusing the previous instance so its
+        session and API token survive between downloads.
         """
+        downloader = getattr(self, 'gofile_downloader', None)
+        if downloader is not None and not downloader.cancel_requested:
+            downloader.download_folder = self.download_folder
+            downloader.max_downloads = self.max_downloads
+            downloader.reset_progress()
+            return
+        from downloader.gofile import GofileDownloader
         self.gofile_downloader = GofileDownloader(
             download_folder=self.download_folder,
             log_callback=self.add_log_message_safe,
@@ -943,7 +1076,8 @@ class ImageDownloaderApp(ctk.CTk):
             max_workers=self.max_downloads,
             tr=self.tr  # Pass the translation function here
         )
-    
+        self._register_downloader(downloader, self.gofile_downloader)
+
     def handle_erome_download(self, url: str):
         """
         Handles downloading from Erome.
@@ -988,7 +1122,7 @@ class ImageDownloaderApp(ctk.CTk):
         self.active_downloader = self.general_downloader
         
         site = parsed_url.netloc
-        service, user, post = extract_ck_parameters(parsed_url)
+        service, user, post, query, offset = extract_ck(parsed_url)
         if not service or not user:
             error_msg = self.tr("Could not extract necessary parameters from the URL.")
             self.add_log_message_safe(error_msg)
@@ -1003,7 +1137,6 @@ class ImageDownloaderApp(ctk.CTk):
             target = self.start_ck_post_download
             args = (site, service, user, post)
         else:
-            query, offset = extract_ck_query(parsed_url)
             self.add_log_message_safe(self.tr("Downloading all user content..." if download_all else "Downloading only posts from the provided URL..."))
             target = self.start_ck_profile_download
             args = (site, service, user, query, download_all, offset)
@@ -1021,9 +1154,10 @@ class ImageDownloaderApp(ctk.CTk):
         args = (url,)
         self.start_download_thread(target, args)
     
-    def handle_jpg5_download(self):
+    def handle_jpg5_download(self, url: str):
         """
-        Handles downloading from Jpg5.
+        Handles downloading from Jpg5; the URL is re-read from the entry by the
+        downloader itself, the argument only satisfies the dispatch table.
         """
         self.add_log_message_safe(self.tr("Downloading from Jpg5"))
         self.setup_jpg5_downloader()
@@ -1034,10 +1168,10 @@ class ImageDownloaderApp(ctk.CTk):
     
     def start_download_thread(self, target, args):
         """
-        Starts a download thread.
+        Submits a download to the persistent orchestration executor, avoiding
+        per-click thread creation.
         """
-        download_thread = threading.Thread(target=self.wrapped_download, args=(target, *args))
-        download_thread.start()
+        self._download_executor.submit(self.wrapped_download, target, *args)
     
     def wrapped_download(self, download_method, *args):
         """
@@ -1048,7 +1182,8 @@ class ImageDownloaderApp(ctk.CTk):
         finally:
             self.active_downloader = None
             self.enable_widgets()
-            self.export_logs()
+            # Snapshot on the UI thread, then write in the background
+            self._enqueue(self.export_logs)
     
     def start_ck_profile_download(self, site: str, service: str, user: str, query: Optional[str], download_all: bool, initial_offset: int):
         """
@@ -1085,18 +1220,21 @@ class ImageDownloaderApp(ctk.CTk):
         for file_id in list(self.progress_bars.keys()):
             self.remove_progress_bar(file_id)
     
-    def show_context_menu(self, event):
-        """
-        Shows the context menu.
-        """
-        self.context_menu.tk_popup(event.x_root, event.y_root)
-        self.context_menu.grab_release()
-    
     # Methods for setting up different downloaders
     def setup_erome_downloader(self, is_profile_download: bool):
         """
-        Configures the Erome downloader.
+        Configures the Erome downloader, reusing the previous instance (and its
+        keep-alive session and thread pool) when it was not cancelled.
         """
+        downloader = getattr(self, 'erome_downloader', None)
+        if downloader is not None and not downloader.cancel_requested:
+            downloader.download_images = self.download_images_check.get()
+            downloader.download_videos = self.download_videos_check.get()
+            downloader.is_profile_download = is_profile_download
+            downloader.total_files = 0
+            downloader.completed_files = 0
+            return
+        from downloader.erome import EromeDownloader
         self.erome_downloader = EromeDownloader(
             root=self,
             enable_widgets_callback=self.enable_widgets,
@@ -1113,11 +1251,20 @@ class ImageDownloaderApp(ctk.CTk):
             max_workers=self.max_downloads,
             tr=self.tr
         )
-    
+        self._register_downloader(downloader, self.erome_downloader)
+
     def setup_simpcity_downloader(self):
         """
-        Configures the SimpCity downloader.
+        Configures the SimpCity downloader, reusing the previous instance when
+        it was not cancelled.
         """
+        downloader = getattr(self, 'simpcity_downloader', None)
+        if downloader is not None and not downloader.cancel_requested:
+            downloader.download_folder = self.download_folder
+            downloader.total_files = 0
+            downloader.completed_files = 0
+            return
+        from downloader.simpcity import SimpCity
         self.simpcity_downloader = SimpCity(
             download_folder=self.download_folder,
             log_callback=self.add_log_message_safe,
@@ -1126,11 +1273,19 @@ class ImageDownloaderApp(ctk.CTk):
             update_global_progress_callback=self.update_global_progress,
             tr=self.tr
         )
-    
+        self._register_downloader(downloader, self.simpcity_downloader)
+
     def setup_bunkr_downloader(self):
         """
-        Configures the Bunkr downloader.
+        Configures the Bunkr downloader, reusing the previous instance (and its
+        keep-alive session) when it was not cancelled.
         """
+        downloader = getattr(self, 'bunkr_downloader', None)
+        if downloader is not None and not downloader.cancel_requested:
+            downloader.download_folder = self.download_folder
+            downloader.reset_progress()
+            return
+        from downloader.bunkr import BunkrDownloader
         self.bunkr_downloader = BunkrDownloader(
             download_folder=self.download_folder,
             log_callback=self.add_log_message_safe,
@@ -1144,11 +1299,32 @@ class ImageDownloaderApp(ctk.CTk):
             max_workers=self.max_downloads,
             tr=self.tr  # Pass the translation function if needed
         )
-        
+        self._register_downloader(downloader, self.bunkr_downloader)
+
     def setup_general_downloader(self):
         """
         Configures the general downloader for coomer.su and kemono.su.
-        """
+
+        An existing instance is reconfigured in place so the requests session
+        (keep-alive connections, DNS cache) carries over; its executor is
+        recreated because Downloader shuts it down after every run.
+        """
+        downloader = getattr(self, 'general_downloader', None)
+        if downloader is not None:
+            downloader.cancel_requested.clear()
+            downloader.download_folder = self.download_folder
+            downloader.download_images = self.download_images_check.get()
+            downloader.download_videos = self.download_videos_check.get()
+            downloader.download_compressed = self.download_compressed_check.get()
+            downloader.folder_structure = self.settings_window.settings.get('folder_structure', 'default')
+            if downloader.shutdown_called:
+                downloader.set_download_mode(downloader.download_mode, self.max_downloads)
+                downloader.shutdown_called = False
+            downloader.skipped_files = []
+            downloader.failed_files = []
+            downloader.futures = []
+            return
+        from downloader.downloader import Downloader
         self.general_downloader = Downloader(
             download_folder=self.download_folder,
             log_callback=self.add_log_message_safe,
@@ -1166,11 +1342,21 @@ class ImageDownloaderApp(ctk.CTk):
             max_workers=self.max_downloads,
             folder_structure=self.settings_window.settings.get('folder_structure', 'default')
         )
-    
+        self._register_downloader(downloader, self.general_downloader)
+
     def setup_jpg5_downloader(self):
         """
-        Configures the Jpg5 downloader.
+        Configures the Jpg5 downloader, reusing the previous instance with the
+        new URL and destination folder.
         """
+        downloader = getattr(self, 'jpg5_downloader', None)
+        if downloader is not None:
+            downloader.cancel_requested.clear()
+            downloader.url = self.url_entry.get().strip()
+            downloader.carpeta_destino = self.download_folder
+            downloader.max_workers = self.max_downloads
+            return
+        from downloader.jpg5 import Jpg5Downloader
         self.jpg5_downloader = Jpg5Downloader(
             url=self.url_entry.get().strip(),
             carpeta_destino=self.download_folder,
@@ -1179,7 +1365,8 @@ class ImageDownloaderApp(ctk.CTk):
             progress_manager=self.progress_manager,
             max_workers=self.max_downloads
         )
-    
+        self._register_downloader(downloader, self.jpg5_downloader)
+
     # Methods related to progress
     def update_progress(self, downloaded: int, total: int, file_id: Optional[str] = None, file_path: Optional[str] = None, speed: Optional[str] = None, eta: Optional[str] = None):
         """
@@ -1203,26 +1390,41 @@ class ImageDownloaderApp(ctk.CTk):
     def tr(self, text: str, **kwargs) -> str:
         """
         Translates the given text using the loaded translations.
-        """
-        translated_text = self.translations.get(text, text)
-        if kwargs:
-            translated_text = translated_text.format(**kwargs)
-        return translated_text
-    
-    # Methods for managing menus and events
-    def toggle_progress_details(self):
-        """
-        Toggles the visibility of progress details.
-        """
-        self.progress_manager.toggle_progress_details()
-    
-    def center_progress_details_frame(self):
-        """
-        Centers the progress details frame.
-        """
-        self.progress_manager.center_progress_details_frame()
+
+        Plain lookups (no format arguments) are memoized per language; the cache
+        is cleared whenever translations are reloaded.
+        """
+        if not kwargs:
+            translated_text = self._tr_cache.get(text)
+            if translated_text is None:
+                translated_text = self.translations.get(text)
+                if translated_text is None:
+                    # Misses translate to themselves, and downloaders pass
+                    # unique per-file messages with URLs embedded; caching
+                    # those would grow the cache without bound
+                    return text
+                self._tr_cache[text] = translated_text
+            return translated_text
+        # The unformatted template is memoized too; only .format runs per call
+        template = self._tr_cache.get(text)
+        if template is None:
+            template = self.translations.get(text)
+            if template is None:
+                return text.format(**kwargs)
+            self._tr_cache[text] = template
+        return template.format(**kwargs)
     
     # Methods for handling downloads
+    # (domain, handler name) table driving start_download; matched against the
+    # parsed hostname so query strings can never false-positive.
+    _HOST_DISPATCH = (
+        ("erome.com", "handle_erome_download"),
+        ("gofile.io", "handle_gofile_download"),
+        ("phica.eu", "handle_phica_download"),
+        ("simpcity.su", "handle_simpcity_download"),
+        ("jpg5.su", "handle_jpg5_download"),
+    )
+
     def start_download(self):
         """
         Starts the download process based on the provided URL.
@@ -1231,105 +1433,121 @@ class ImageDownloaderApp(ctk.CTk):
         if not self.download_folder:
             messagebox.showerror(self.tr("Error"), self.tr("Please select a download folder."))
             return
-        
+
         self.download_button.configure(state="disabled")
         self.cancel_button.configure(state="normal")
         self.download_start_time = datetime.datetime.now()
         self.errors = []
         download_all = self.download_all_check.get()
-        
+
         parsed_url = urlparse(url)
-        
-        if "erome.com" in url:
-            self.handle_erome_download(url)
-        elif re.search(r"https?://([a-z0-9-]+\.)?bunkr\.[a-z]{2,}", url):
-            self.handle_bunkr_download(url)
-        elif re.search(r"https?://([a-z0-9-]+\.)?bunkrr\.[a-z]{2,}", url):
-            self.handle_bunkr_download(url)
-        elif re.search(r"https?://([a-z0-9-]+\.)?bunkrrr\.[a-z]{2,}", url):
-            self.handle_bunkr_download(url)
-        elif parsed_url.netloc in ["coomer.su", "kemono.su"]:
+        host = parsed_url.netloc.lower()
+
+        if host in _CK_HOSTS:
             self.handle_general_download(parsed_url, download_all)
-        elif "gofile.io" in url:
-            self.handle_gofile_download(url)        
-        elif "phica.eu" in url:
-            self.handle_phica_download(url)
-        elif "simpcity.su" in url:
-            self.handle_simpcity_download(url)
-        elif "jpg5.su" in url:
-            self.handle_jpg5_download()
-        else:
-            self.add_log_message_safe(self.tr("Invalid URL"))
-            self.download_button.configure(state="normal")
-            self.cancel_button.configure(state="disabled")
-    
-    def start_ck_profile_download(self, site: str, service: str, user: str, query: Optional[str], download_all: bool, initial_offset: int):
-        """
-        Starts downloading an entire profile.
-        """
-        download_info = self.active_downloader.download_media(site, user, service, query=query, download_all=download_all, initial_offset=initial_offset)
-        if download_info:
-            self.add_log_message_safe(f"Download info: {download_info}")
-    
-    def start_ck_post_download(self, site: str, service: str, user: str, post: str):
-        """
-        Starts downloading a single post.
-        """
-        download_info = self.active_downloader.download_single_post(site, post, service, user)
-        if download_info:
-            self.add_log_message_safe(f"Download info: {download_info}")
-    
-    def wrapped_download(self, download_method, *args):
-        """
-        Wraps the download method to handle completion.
-        """
-        try:
-            download_method(*args)
-        finally:
-            self.active_downloader = None
-            self.enable_widgets()
-            self.export_logs()
-    
+            return
+        if _BUNKR_HOST_RE.search(host):
+            self.handle_bunkr_download(url)
+            return
+        for domain, handler_name in self._HOST_DISPATCH:
+            if host == domain or host.endswith('.' + domain):
+                getattr(self, handler_name)(url)
+                return
+        self.add_log_message_safe(self.tr("Invalid URL"))
+        self.download_button.configure(state="normal")
+        self.cancel_button.configure(state="disabled")
+
     # Methods for handling menus and events
     def on_click(self, event):
         """
         Closes dropdown menus if clicked outside of them.
-        """
-        widgets_to_ignore = [self.menu_bar]
-        for frame in [self.archivo_menu_frame, self.ayuda_menu_frame, self.donaciones_menu_frame]:
-            if frame and frame.winfo_exists():
-                widgets_to_ignore.append(frame)
-                widgets_to_ignore.extend(self.get_all_children(frame))
-        if event.widget not in widgets_to_ignore:
+
+        With no menu open this is a constant-time early return; otherwise the
+        ignore set is built once per open menu and reused for O(1) membership.
+        """
+        open_frames = [
+            frame
+            for frame in (self.archivo_menu_frame, self.ayuda_menu_frame, self.donaciones_menu_frame)
+            if frame and frame.winfo_exists()
+        ]
+        if not open_frames:
+            return
+        if self._menu_ignore_cache is None:
+            ignore = {id(self.menu_bar)}
+            for frame in open_frames:
+                ignore.add(id(frame))
+                ignore.update(id(child) for child in self.iter_descendants(frame))
+            self._menu_ignore_cache = frozenset(ignore)
+        if id(event.widget) not in self._menu_ignore_cache:
             self.close_all_menus()
     
+    def iter_descendants(self, widget: tk.Widget):
+        """
+        Yields all descendants of a widget without materializing a list, so
+        callers that stop early never pay for the full walk.
+        """
+        stack = deque(widget.winfo_children())
+        while stack:
+            child = stack.popleft()
+            yield child
+            stack.extend(child.winfo_children())
+
     def get_all_children(self, widget: tk.Widget) -> list:
         """
-        Recursively gets all children of a widget.
+        Gets all descendants of a widget as a list.
         """
-        children = widget.winfo_children()
-        all_children = list(children)
-        for child in children:
-            all_children.extend(self.get_all_children(child))
-        return all_children
-    
+        return list(self.iter_descendants(widget))
+
     # Methods for handling the update queue
     def check_update_queue(self):
         """
-        Checks and executes tasks in the update queue.
+        Executes tasks in the update queue.
+
+        Scheduled on demand by producers via after_idle rather than by a
+        periodic 100 ms poll, so an idle app does no queue work at all.
         """
-        while not self.update_queue.empty():
-            task = self.update_queue.get_nowait()
-            task()
-        self.after(100, self.check_update_queue)
-    
+        self._update_scheduled = False
+        q = self.update_queue
+        while True:
+            try:
+                task = q.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                task()
+            except Exception as e:
+                self.add_log_message_safe(f"Error in UI update task: {e}")
+
+    def _schedule_update_drain(self):
+        """
+        Arms a one-shot idle callback to drain the update queue.
+        """
+        if not self._update_scheduled:
+            self._update_scheduled = True
+            self.after_idle(self.check_update_queue)
+
+    def _enqueue(self, task):
+        """
+        Queues a UI task and arms the idle drain.
+
+        Producers go through this helper so every enqueue wakes the dispatcher
+        exactly once instead of relying on a periodic poll.
+        """
+        self.update_queue.put(task)
+        self._schedule_update_drain()
+
     def enable_widgets(self):
         """
         Enables widgets after an operation.
+
+        All three configures run as a single queued task, so completion costs
+        one queue round-trip instead of three.
         """
-        self.update_queue.put(lambda: self.download_button.configure(state="normal"))
-        self.update_queue.put(lambda: self.cancel_button.configure(state="disabled"))
-        self.update_queue.put(lambda: self.download_all_check.configure(state="normal"))
+        def _reenable():
+            self.download_button.configure(state="normal")
+            self.cancel_button.configure(state="disabled")
+            self.download_all_check.configure(state="normal")
+        self._enqueue(_reenable)
     
     # Methods for error handling and logging
     def log_error(self, error_message: str):
@@ -1346,21 +1564,3 @@ class ImageDownloaderApp(ctk.CTk):
         self.warnings.append(warning_message)
         self.add_log_message_safe(f"Warning: {warning_message}")
     
-    # Methods for loading icons
-    def load_github_icon(self) -> Optional[ctk.CTkImage]:
-        """
-        Loads the GitHub icon.
-        """
-        return self.load_icon("resources/img/github-logo-24.png", "GitHub")
-    
-    def load_discord_icon(self) -> Optional[ctk.CTkImage]:
-        """
-        Loads the Discord icon.
-        """
-        return self.load_icon("resources/img/discord-alt-logo-24.png", "Discord")
-    
-    def load_new_icon(self) -> Optional[ctk.CTkImage]:
-        """
-        Loads the new support icon.
-        """
-        return self.load_icon("resources/img/dollar-circle-solid-24.png", "New Icon")
\ No newline at end of file
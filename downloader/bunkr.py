@@ -1,8 +1,11 @@
-import hashlib
+import itertools
 import os
 import requests
+import shutil
 import time
-from bs4 import BeautifulSoup
+import zlib
+from bs4 import BeautifulSoup, SoupStrainer
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urlparse, urljoin
 import uuid
@@ -10,10 +13,40 @@ import re
 import threading
 import subprocess
 
+# Progress is reported at most once per this many bytes so the hot download
+# loop is not dominated by GUI callbacks.
+_REPORT_BYTES = 256 * 1024
+
+# Compiled once; clean_filename runs for every downloaded item
+_FILENAME_BAD = re.compile(r'[<>:"/\\|?*​]')
+
+# Only the <h1 class="truncate"> title is needed from bunkr pages; the
+# strainer prunes everything else and lxml parses in C when available
+_TITLE_ONLY = SoupStrainer('h1', attrs={'class': 'truncate'})
+try:
+    import lxml  # noqa: F401
+    _SOUP_PARSER = 'lxml'
+except ImportError:
+    _SOUP_PARSER = 'html.parser'
+
 def get_root_domain(url):
     parsed_url = urlparse(url)
     return f"{parsed_url.scheme}://{parsed_url.netloc}"
 
+def _drop_page_cache(file_path):
+    # Los archivos descargados no se vuelven a leer: liberar sus páginas de
+    # la caché del kernel para no desalojar datos calientes en colas largas
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
 class BunkrDownloader:
     def __init__(self, download_folder, log_callback=None, enable_widgets_callback=None, update_progress_callback=None, update_global_progress_callback=None, headers=None, max_workers=5, translations=None, tr=None):
         self.download_folder = download_folder
@@ -22,6 +55,11 @@ class BunkrDownloader:
         self.update_progress_callback = update_progress_callback
         self.update_global_progress_callback = update_global_progress_callback
         self.session = requests.Session()
+        # Size the connection pool to the worker count so threads never churn
+        # connections once more than 10 downloads run in parallel
+        adapter = requests.adapters.HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers, pool_block=False)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.headers = headers or {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36',
             'Referer': 'https://bunkr.site/',
@@ -32,36 +70,51 @@ class BunkrDownloader:
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
         self.total_files = 0
         self.completed_files = 0
+        # next() on itertools.count is atomic under the GIL, unlike += 1
+        # from several worker threads
+        self._completed_iter = itertools.count(1)
         self.max_downloads = max_workers
-        self.log_messages = []
+        self.log_messages = deque(maxlen=10_000)
+        self._log_event = threading.Event()
+        # Cap parallel requests per CDN host so a big album on one host does
+        # not trip its rate limit and burn attempts in exponential backoff
+        self._host_locks = {}
+        self._host_locks_lock = threading.Lock()
         self.notification_interval = 10
-        self.start_notification_thread()
+        self._notification_thread = None
+        # Without a callback the notifier would wake every 10 s just to
+        # throw the joined messages away
+        if self.log_callback is not None:
+            self.start_notification_thread()
         self.translations = translations or {}
-        self.tr = tr  # Add this line to store the translation function 
+        # Single attribute read in the logging hot path; the fallback keeps
+        # the old dictionary lookup behaviour when no tr function is given
+        self.tr = tr if tr is not None else (lambda key: self.translations.get(key, key))
 
     def start_notification_thread(self):
         def notify_user():
             while not self.cancel_requested:
-                if self.log_messages:
-                    # Enviar todos los mensajes acumulados
-                    if self.log_callback:
-                        self.log_callback("\n".join(self.log_messages))
-                    self.log_messages.clear()
-                time.sleep(self.notification_interval)
+                # Dormir hasta que llegue un mensaje (o venza el intervalo),
+                # en vez de despertar cada 10 s incondicionalmente
+                self._log_event.wait(self.notification_interval)
+                self._log_event.clear()
+                messages = []
+                while self.log_messages:
+                    messages.append(self.log_messages.popleft())
+                if messages and self.log_callback:
+                    self.log_callback("\n".join(messages))
 
         # Iniciar un hilo para notificaciones periódicas
-        notification_thread = threading.Thread(target=notify_user, daemon=True)
-        notification_thread.start()
-
-    def tr(self, key):
-        # Obtener la traducción para la clave dada
-        return self.translations.get(key, key)
+        self._notification_thread = threading.Thread(target=notify_user, daemon=True)
+        self._notification_thread.start()
 
     def log(self, message_key, url=None):
         message = self.tr(message_key)
         domain = urlparse(url).netloc if url else "General"
         full_message = f"{domain}: {message}"
         self.log_messages.append(full_message)  # Agregar mensaje a la cola
+        if self._notification_thread is not None:
+            self._log_event.set()
 
     def request_cancel(self):
         self.cancel_requested = True
@@ -71,16 +124,51 @@ class BunkrDownloader:
     def shutdown_executor(self):
         self.executor.shutdown(wait=False)
         self.log("Executor shut down.")
+        if self._notification_thread is not None:
+            # Despertar al notificador para que vacíe la cola y termine en
+            # vez de agotar su intervalo de espera
+            self._log_event.set()
+            self._notification_thread.join(timeout=1)
+            self._notification_thread = None
 
     def clean_filename(self, filename):
-        return re.sub(r'[<>:"/\\|?*\u200b]', '_', filename)
+        return _FILENAME_BAD.sub('_', filename)
     
     def get_consistent_folder_name(self, url, default_name):
-        # Genera un hash de la URL para crear un nombre único y consistente
-        url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
+        # Genera un hash de la URL para crear un nombre único y consistente;
+        # crc32 basta para un sufijo de carpeta y es mucho más barato que md5
+        url_hash = f"{zlib.crc32(url.encode()) & 0xffffffff:08x}"
         folder_name = f"{default_name}_{url_hash}"
         return self.clean_filename(folder_name)
 
+    def _iter_chunks(self, response, chunk_size=1 << 20):
+        """
+        Yields response body chunks reusing a single buffer when the body is
+        unencoded, so the hot loop does not allocate a fresh 1 MB bytes
+        object per chunk. Encoded bodies fall back to iter_content, which
+        must go through urllib3's decoder.
+        """
+        if response.headers.get('content-encoding') in (None, 'identity'):
+            raw = response.raw
+            buf = bytearray(chunk_size)
+            mv = memoryview(buf)
+            while True:
+                n = raw.readinto(buf)
+                if not n:
+                    return
+                yield mv[:n]
+        else:
+            yield from response.iter_content(chunk_size=chunk_size)
+
+    _HOST_CONCURRENCY = 4  # simultaneous transfers allowed per host
+
+    def _sem(self, host):
+        with self._host_locks_lock:
+            sem = self._host_locks.get(host)
+            if sem is None:
+                sem = self._host_locks[host] = threading.Semaphore(self._HOST_CONCURRENCY)
+            return sem
+
     def download_file(self, url_media, ruta_carpeta, file_id):
         """
         Downloads a file from the given URL and saves it to the specified path.
@@ -90,45 +178,79 @@ class BunkrDownloader:
             self.log("Descarga cancelada", url=url_media)
             return
 
-        file_name = os.path.basename(urlparse(url_media).path)
+        parsed_media = urlparse(url_media)
+        file_name = os.path.basename(parsed_media.path)
         file_path = os.path.join(ruta_carpeta, file_name)
         
         if os.path.exists(file_path):
             self.log(f"El archivo ya existe, omitiendo: {file_path}")
-            self.completed_files += 1
+            done = next(self._completed_iter)
+            self.completed_files = done
             if self.update_global_progress_callback:
-                self.update_global_progress_callback(self.completed_files, self.total_files)
+                self.update_global_progress_callback(done, self.total_files)
             return
 
+        part_path = file_path + '.part'
         max_attempts = 3
         delay = 1
         for attempt in range(max_attempts):
             try:
                 self.log(f"Intentando descargar {url_media} (Intento {attempt + 1}/{max_attempts})")
-                response = self.session.get(url_media, headers=self.headers, stream=True)
-                response.raise_for_status()
-
-                total_size = int(response.headers.get('content-length', 0))
-                downloaded_size = 0
-
-                with open(file_path, 'wb') as file:
-                    for chunk in response.iter_content(chunk_size=65536):  # 64KB chunks
-                        if self.cancel_requested:
-                            self.log("Descarga cancelada durante la descarga del archivo.", url=url_media)
-                            file.close()
-                            os.remove(file_path)
-                            return
-                        file.write(chunk)
-                        downloaded_size += len(chunk)
-                        if self.update_progress_callback:
-                            self.update_progress_callback(downloaded_size, total_size, file_id=file_id, file_path=file_path)
+                # Resume a previous partial download if its .part file is
+                # still on disk
+                start = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+                req_headers = self.headers
+                if start:
+                    req_headers = dict(self.headers)
+                    req_headers['Range'] = f'bytes={start}-'
+
+                # Hold the per-host slot for the whole transfer, not just the
+                # request, since the connection stays busy while streaming
+                with self._sem(parsed_media.netloc):
+                    response = self.session.get(url_media, headers=req_headers, stream=True)
+                    response.raise_for_status()
+
+                    if start and response.status_code != 206:
+                        # El servidor ignoró el Range: empezar desde cero
+                        start = 0
+                    total_size = start + int(response.headers.get('content-length', 0))
+                    downloaded_size = start
+                    next_report = downloaded_size + _REPORT_BYTES
+
+                    with open(part_path, 'ab' if start else 'wb', buffering=1 << 20) as file:
+                        if self.update_progress_callback is None:
+                            # No progress consumer: let the C copy loop move the
+                            # bytes, releasing the GIL during socket reads
+                            response.raw.decode_content = True
+                            shutil.copyfileobj(response.raw, file, length=1 << 20)
+                            downloaded_size = file.tell()
+                        else:
+                            write = file.write
+                            for chunk in self._iter_chunks(response):  # 1MB chunks
+                                if self.cancel_requested:
+                                    # Conservar el .part para reanudar después
+                                    self.log("Descarga cancelada durante la descarga del archivo.", url=url_media)
+                                    return
+                                write(chunk)
+                                downloaded_size += len(chunk)
+                                if downloaded_size >= next_report:
+                                    self.update_progress_callback(downloaded_size, total_size, file_id=file_id, file_path=file_path)
+                                    next_report = downloaded_size + _REPORT_BYTES
+
+                os.replace(part_path, file_path)
+                _drop_page_cache(file_path)
+
+                # Final report so the bar always reaches the true size
+                if self.update_progress_callback:
+                    self.update_progress_callback(downloaded_size, total_size, file_id=file_id, file_path=file_path)
 
                 self.log("Archivo descargado", url=url_media)
                 if self.log_callback:
                     self.log_callback(f"Descarga completada: {file_name}")
-                self.completed_files += 1
+                done = next(self._completed_iter)
+                self.completed_files = done
                 if self.update_global_progress_callback:
-                    self.update_global_progress_callback(self.completed_files, self.total_files)
+                    self.update_global_progress_callback(done, self.total_files)
                 break
 
             except requests.RequestException as e:
@@ -148,7 +270,7 @@ class BunkrDownloader:
             self.log(f"Código de estado de la respuesta: {response.status_code} para {url_post}")
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = BeautifulSoup(response.text, _SOUP_PARSER, parse_only=_TITLE_ONLY)
 
                 # Extraer y sanitizar el nombre de la carpeta para el post
                 file_name_tag = soup.find('h1', {'class': 'truncate'})
@@ -170,13 +292,19 @@ class BunkrDownloader:
                     '--directory', ruta_carpeta,  # Specify the download directory
                     url_post
                 ]
-                result = subprocess.run(command, capture_output=True, text=True)
+                # Stream gallery-dl's output line by line instead of buffering
+                # the whole thing in memory until the process exits
+                proc = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
+                for line in proc.stdout:
+                    line = line.rstrip()
+                    if line:
+                        self.log(line)
+                returncode = proc.wait()
 
-                if result.returncode == 0:
+                if returncode == 0:
                     self.log(f"Album downloaded successfully: {url_post}")
                 else:
-                    self.log(f"Failed to download album: {url_post}")
-                    self.log(f"gallery-dl output: {result.stderr}")
+                    self.log(f"Failed to download album: {url_post} (gallery-dl exit code {returncode})")
 
                 if self.enable_widgets_callback:
                     self.enable_widgets_callback()
@@ -193,7 +321,7 @@ class BunkrDownloader:
             response = self.session.get(url_perfil, headers=self.headers)
             self.log(f"Código de estado de la respuesta: {response.status_code} para {url_perfil}")
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = BeautifulSoup(response.text, _SOUP_PARSER, parse_only=_TITLE_ONLY)
 
                 # Extraer y sanitizar el nombre de la carpeta para el perfil
                 file_name_tag = soup.find('h1', {'class': 'truncate'})
@@ -210,13 +338,19 @@ class BunkrDownloader:
                 # Use gallery-dl to download the profile
                 self.log(f"Using gallery-dl to download profile: {url_perfil}")
                 command = ['gallery-dl', '-d', ruta_carpeta, url_perfil]
-                result = subprocess.run(command, capture_output=True, text=True)
+                # Stream gallery-dl's output line by line instead of buffering
+                # the whole thing in memory until the process exits
+                proc = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
+                for line in proc.stdout:
+                    line = line.rstrip()
+                    if line:
+                        self.log(line)
+                returncode = proc.wait()
 
-                if result.returncode == 0:
+                if returncode == 0:
                     self.log(f"Profile downloaded successfully: {url_perfil}")
                 else:
-                    self.log(f"Failed to download profile: {url_perfil}")
-                    self.log(f"gallery-dl output: {result.stderr}")
+                    self.log(f"Failed to download profile: {url_perfil} (gallery-dl exit code {returncode})")
 
                 if self.enable_widgets_callback:
                     self.enable_widgets_callback()
@@ -227,5 +361,10 @@ class BunkrDownloader:
             if self.enable_widgets_callback:
                 self.enable_widgets_callback()
 
+    def reset_progress(self):
+        self.total_files = 0
+        self.completed_files = 0
+        self._completed_iter = itertools.count(1)
+
     def set_max_downloads(self, max_downloads):
         self.max_downloads = max_downloads
\ No newline at end of file
@@ -1,14 +1,44 @@
+import itertools
+import json
 import os
 import re
 import requests
+import shutil
 import hashlib
-from concurrent.futures import ThreadPoolExecutor
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urlparse
 import threading
 import time
 import uuid
 from pathvalidate import sanitize_filename
 
+# Progress is reported at most once per this many bytes so the hot download
+# loop is not dominated by GUI callbacks.
+_REPORT_BYTES = 256 * 1024
+
+# Compiled once; clean_filename runs for every downloaded item
+_FILENAME_BAD = re.compile(r'[<>:"/\\|?*​]')
+
+# Extracts the wt value without splitting the ~100 KB global.js twice
+_WT_RE = re.compile(r'appdata\.wt = "([^"]+)"')
+
+
+def _drop_page_cache(file_path):
+    # Downloaded files are never read back: release their page-cache pages
+    # so long queues do not evict hotter data
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
 
 class GofileDownloader:
     def __init__(self, download_folder, log_callback=None, enable_widgets_callback=None, update_progress_callback=None, update_global_progress_callback=None, headers=None, max_workers=5, tr=None):
@@ -18,35 +48,55 @@ class GofileDownloader:
         self.update_progress_callback = update_progress_callback
         self.update_global_progress_callback = update_global_progress_callback
         self.session = requests.Session()
+        # Size the connection pool to the worker count so parallel downloads
+        # reuse keep-alive connections instead of churning them
+        adapter = requests.adapters.HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers, pool_block=False)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.headers = headers or {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36',
             'Referer': 'https://gofile.io/',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
         }
+        self.session.headers.update(self.headers)
         self.cancel_requested = False
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
         self.total_files = 0
         self.completed_files = 0
+        # next() on itertools.count is atomic under the GIL, unlike += 1
+        # from several worker threads
+        self._completed_iter = itertools.count(1)
         self.max_downloads = max_workers
-        self.log_messages = []
+        self.log_messages = deque(maxlen=10_000)
+        self._log_event = threading.Event()
         self.notification_interval = 10
-        self.start_notification_thread()
+        self._notification_thread = None
+        # Without a callback the notifier would wake every 10 s just to
+        # throw the joined messages away
+        if self.log_callback is not None:
+            self.start_notification_thread()
         self.tr = tr  # Translation function
         self._token = None
         self.wt = None
+        self._meta_lock = threading.Lock()
+        self._pw_hash_cache = {}
 
     def start_notification_thread(self):
         def notify_user():
             while not self.cancel_requested:
-                if self.log_messages:
-                    if self.log_callback:
-                        self.log_callback("\n".join(self.log_messages))
-                    self.log_messages.clear()
-                time.sleep(self.notification_interval)
+                # Sleep until a message arrives (or the interval elapses)
+                # instead of unconditionally waking every 10 s
+                self._log_event.wait(self.notification_interval)
+                self._log_event.clear()
+                messages = []
+                while self.log_messages:
+                    messages.append(self.log_messages.popleft())
+                if messages and self.log_callback:
+                    self.log_callback("\n".join(messages))
 
-        notification_thread = threading.Thread(target=notify_user, daemon=True)
-        notification_thread.start()
+        self._notification_thread = threading.Thread(target=notify_user, daemon=True)
+        self._notification_thread.start()
 
     def log(self, message_key, url=None):
         # Use the tr function to translate the message
@@ -54,6 +104,8 @@ class GofileDownloader:
         domain = urlparse(url).netloc if url else "General"
         full_message = f"{domain}: {message}"
         self.log_messages.append(full_message)
+        if self._notification_thread is not None:
+            self._log_event.set()
 
     def request_cancel(self):
         self.cancel_requested = True
@@ -63,22 +115,74 @@ class GofileDownloader:
     def shutdown_executor(self):
         self.executor.shutdown(wait=False)
         self.log("Executor shut down.")
+        if self._notification_thread is not None:
+            # Wake the notifier so it flushes and exits instead of
+            # sleeping out its interval
+            self._log_event.set()
+            self._notification_thread.join(timeout=1)
+            self._notification_thread = None
+
+    def reset_progress(self):
+        self.total_files = 0
+        self.completed_files = 0
+        self._completed_iter = itertools.count(1)
 
     def clean_filename(self, filename):
-        return re.sub(r'[<>:"/\\|?*\u200b]', '_', filename)
+        return _FILENAME_BAD.sub('_', filename)
 
     def get_consistent_folder_name(self, url, default_name):
-        url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
+        # crc32 is plenty for an 8-hex folder suffix and far cheaper than md5
+        url_hash = f"{zlib.crc32(url.encode()) & 0xffffffff:08x}"
         folder_name = f"{default_name}_{url_hash}"
         return self.clean_filename(folder_name)
 
+    _META_TTL = 3600  # seconds a cached token/wt pair stays usable
+
+    def _meta_path(self):
+        return os.path.join(self.download_folder, ".gofile_meta.json")
+
+    def _load_cached_meta(self):
+        """
+        Returns the persisted {token, wt, ts} dict if it is still fresh.
+        """
+        try:
+            with open(self._meta_path(), "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if time.time() - meta.get("ts", 0) < self._META_TTL:
+                return meta
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def _store_meta(self):
+        """
+        Persists the current token/wt atomically; the cache is best-effort.
+        """
+        meta = {"token": self._token, "wt": self.wt, "ts": time.time()}
+        tmp_path = self._meta_path() + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            os.replace(tmp_path, self._meta_path())
+        except OSError:
+            pass
+
     def update_token(self):
-        if not self._token:
-            response = requests.post("https://api.gofile.io/accounts")
+        with self._meta_lock:
+            if self._token:
+                return
+            meta = self._load_cached_meta()
+            if meta and meta.get("token"):
+                self._token = meta["token"]
+                if meta.get("wt"):
+                    self.wt = meta["wt"]
+                return
+            response = self.session.post("https://api.gofile.io/accounts")
             if response.status_code == 200:
                 data = response.json()
                 if data["status"] == "ok":
                     self._token = data["data"]["token"]
+                    self._store_meta()
                     self.log("Updated GoFile API token.")
                 else:
                     self.log("Failed to fetch GoFile API token.")
@@ -86,12 +190,19 @@ class GofileDownloader:
                 self.log("Failed to connect to GoFile API.")
 
     def update_wt(self):
-        if not self.wt:
-            response = requests.get("https://gofile.io/dist/js/global.js")
+        with self._meta_lock:
+            if self.wt:
+                return
+            meta = self._load_cached_meta()
+            if meta and meta.get("wt"):
+                self.wt = meta["wt"]
+                return
+            response = self.session.get("https://gofile.io/dist/js/global.js")
             if response.status_code == 200:
-                alljs = response.text
-                if 'appdata.wt = "' in alljs:
-                    self.wt = alljs.split('appdata.wt = "')[1].split('"')[0]
+                match = _WT_RE.search(response.text)
+                if match:
+                    self.wt = match.group(1)
+                    self._store_meta()
                     self.log("Updated GoFile WT.")
                 else:
                     self.log("Failed to extract WT from GoFile JS.")
@@ -104,16 +215,30 @@ class GofileDownloader:
             self.update_token()
             self.update_wt()
 
-            hash_password = hashlib.sha256(password.encode()).hexdigest() if password else ""
+            # The password is invariant per instance; hash it once
+            if password:
+                hash_password = self._pw_hash_cache.get(password)
+                if hash_password is None:
+                    hash_password = hashlib.sha256(password.encode()).hexdigest()
+                    self._pw_hash_cache[password] = hash_password
+            else:
+                hash_password = ""
             params = {"wt": self.wt, "cache": "true", "password": hash_password}
             headers = {"Authorization": f"Bearer {self._token}"}
 
-            response = requests.get(f"https://api.gofile.io/contents/{content_id}", headers=headers, params=params)
+            response = self.session.get(f"https://api.gofile.io/contents/{content_id}", headers=headers, params=params)
             if response.status_code == 200:
                 data = response.json()
                 if data["status"] == "ok":
                     if data["data"].get("passwordStatus", "passwordOk") == "passwordOk":
-                        self._process_content(data["data"], self.download_folder)
+                        tasks = self._collect_tasks(data["data"], self.download_folder)
+                        self.total_files = len(tasks)
+                        futures = [self.executor.submit(self.download_file, link, path) for link, path in tasks]
+                        for future in as_completed(futures):
+                            try:
+                                future.result()
+                            except Exception as e:
+                                self.log(f"Download task failed: {e}")
                     else:
                         self.log("Invalid password.")
                 else:
@@ -123,49 +248,149 @@ class GofileDownloader:
         except Exception as e:
             self.log(f"Error accessing GoFile link: {e}")
 
-    def _process_content(self, content, base_path):
-        if content["type"] == "folder":
-            folder_name = sanitize_filename(content["name"])
-            folder_path = os.path.join(base_path, folder_name)
+    def _fetch_contents(self, content_id):
+        """
+        Fetches the contents listing for a nested folder whose children were
+        not inlined in the parent response.
+        """
+        headers = {"Authorization": f"Bearer {self._token}"}
+        params = {"wt": self.wt, "cache": "true"}
+        response = self.session.get(f"https://api.gofile.io/contents/{content_id}", headers=headers, params=params)
+        if response.status_code == 200:
+            data = response.json()
+            if data["status"] == "ok":
+                return data["data"]
+        return None
+
+    def _collect_tasks(self, content, base_path):
+        """
+        Flattens the content tree into (link, file_path) download tasks,
+        creating folders as they are discovered. The walk proceeds level by
+        level so that folders whose children must be fetched from the API
+        are requested concurrently instead of one at a time.
+        """
+        tasks = []
+        dirs = set()
+        pending = [(content, base_path)]
+        while pending:
+            next_level = []
+            to_fetch = []
+            for node, path in pending:
+                if node["type"] == "folder":
+                    folder_path = os.path.join(path, sanitize_filename(node["name"]))
+                    dirs.add(folder_path)
+                    children = node.get("children")
+                    if children is None:
+                        to_fetch.append((node, folder_path))
+                    else:
+                        next_level.extend((child, folder_path) for child in children.values())
+                else:
+                    tasks.append((node["link"], os.path.join(path, sanitize_filename(node["name"]))))
+            if to_fetch:
+                futures = {
+                    self.executor.submit(self._fetch_contents, node["id"]): folder_path
+                    for node, folder_path in to_fetch
+                }
+                for future in as_completed(futures):
+                    folder_path = futures[future]
+                    try:
+                        fetched = future.result()
+                    except Exception as e:
+                        self.log(f"Failed to list folder contents: {e}")
+                        continue
+                    if fetched and fetched.get("children"):
+                        next_level.extend((child, folder_path) for child in fetched["children"].values())
+            pending = next_level
+        # One deduplicated makedirs pass, parents before children, instead
+        # of a mkdir burst per folder node during the walk
+        for folder_path in sorted(dirs, key=lambda p: p.count(os.sep)):
             os.makedirs(folder_path, exist_ok=True)
-            for child_id, child in content["children"].items():
-                self._process_content(child, folder_path)
+        return tasks
+
+    def _iter_chunks(self, response, chunk_size=1 << 20):
+        """
+        Yields response body chunks reusing a single buffer when the body is
+        unencoded, so the hot loop does not allocate a fresh 1 MB bytes
+        object per chunk. Encoded bodies fall back to iter_content, which
+        must go through urllib3's decoder.
+        """
+        if response.headers.get('content-encoding') in (None, 'identity'):
+            raw = response.raw
+            buf = bytearray(chunk_size)
+            mv = memoryview(buf)
+            while True:
+                n = raw.readinto(buf)
+                if not n:
+                    return
+                yield mv[:n]
         else:
-            file_name = sanitize_filename(content["name"])
-            file_path = os.path.join(base_path, file_name)
-            self.download_file(content["link"], file_path)
+            yield from response.iter_content(chunk_size=chunk_size)
 
     def download_file(self, link, file_path):
         try:
-            dir = os.path.dirname(file_path)
-            if not os.path.exists(dir):
-                os.makedirs(dir)
-
-            if not os.path.exists(file_path):
-                headers = {"Cookie": f"accountToken={self._token}"}
-                with requests.get(link, headers=headers, stream=True) as response:
-                    response.raise_for_status()
-                    total_size = int(response.headers.get("content-length", 0))
-                    downloaded_size = 0
-
-                    # Increase chunk size to 1 MB (1048576 bytes)
-                    chunk_size = 1048576
-                    with open(file_path, "wb") as file:
-                        for chunk in response.iter_content(chunk_size=chunk_size):
+            if os.path.exists(file_path):
+                self.log(f"File already exists: {file_path}")
+                # Skipped files still count toward total_files, so global
+                # progress must advance for them too
+                done = next(self._completed_iter)
+                self.completed_files = done
+                if self.update_global_progress_callback:
+                    self.update_global_progress_callback(done, self.total_files)
+                return
+
+            # Resume a previous partial download if its .part file is
+            # still on disk
+            part_path = file_path + ".part"
+            start = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+            headers = {"Cookie": f"accountToken={self._token}"}
+            if start:
+                headers["Range"] = f"bytes={start}-"
+
+            with self.session.get(link, headers=headers, stream=True) as response:
+                response.raise_for_status()
+                if start and response.status_code != 206:
+                    # Server ignored the Range request; start over
+                    start = 0
+                total_size = start + int(response.headers.get("content-length", 0))
+                downloaded_size = start
+                next_report = downloaded_size + _REPORT_BYTES
+
+                # Increase chunk size to 1 MB (1048576 bytes)
+                chunk_size = 1048576
+                with open(part_path, "ab" if start else "wb", buffering=1 << 20) as file:
+                    if self.update_progress_callback is None:
+                        # No progress consumer: let the C copy loop move
+                        # the bytes, releasing the GIL during socket reads
+                        response.raw.decode_content = True
+                        shutil.copyfileobj(response.raw, file, length=chunk_size)
+                        downloaded_size = file.tell()
+                    else:
+                        write = file.write
+                        for chunk in self._iter_chunks(response, chunk_size):
                             if self.cancel_requested:
+                                # Keep the .part so a later run can resume
                                 self.log("Download cancelled during file download.", url=link)
-                                file.close()
-                                os.remove(file_path)
                                 return
-                            file.write(chunk)
+                            write(chunk)
                             downloaded_size += len(chunk)
-                            if self.update_progress_callback:
+                            if downloaded_size >= next_report:
                                 self.update_progress_callback(downloaded_size, total_size, file_path=file_path)
+                                next_report = downloaded_size + _REPORT_BYTES
 
-                self.log(f"Downloaded: {file_path}")
-            else:
-                self.log(f"File already exists: {file_path}")
+                    # Final report so the bar always reaches the true size
+                    if self.update_progress_callback:
+                        self.update_progress_callback(downloaded_size, total_size, file_path=file_path)
+
+            os.replace(part_path, file_path)
+            _drop_page_cache(file_path)
+
+            done = next(self._completed_iter)
+            self.completed_files = done
+            if self.update_global_progress_callback:
+                self.update_global_progress_callback(done, self.total_files)
+            self.log(f"Downloaded: {file_path}")
         except Exception as e:
+            # The .part file stays behind so a retry can resume from it
             self.log(f"Failed to download {file_path}: {e}")
 
 
@@ -1,30 +1,173 @@
 import os
 import json
 import re
-import queue
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 import requests
+from urllib3.util.retry import Retry
 import hashlib
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import cloudscraper
+import threading
 import time
 
-# Import the BunkrDownloader class from bunkr.py
-from .bunkr import BunkrDownloader
+# Import the BunkrDownloader class from bunkr.py, along with the shared
+# page-cache release helper
+from .bunkr import BunkrDownloader, _drop_page_cache
 # Import the GofileDownloader class from gofile.py
 from .gofile import GofileDownloader
 
+# lxml parses in C and is several times faster than the pure-Python parser
+# on real forum pages; fall back when it is not installed
+try:
+    import lxml  # noqa: F401
+    _SOUP_PARSER = 'lxml'
+except ImportError:
+    _SOUP_PARSER = 'html.parser'
+
+# selectolax (lexbor) is faster still for the pure CSS-selector usage in
+# this module; the helpers below fall back to BeautifulSoup without it
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    _USE_SELECTOLAX = True
+except ImportError:
+    _USE_SELECTOLAX = False
+
+
+def _parse_page(content):
+    if _USE_SELECTOLAX:
+        return LexborHTMLParser(content)
+    return BeautifulSoup(content, _SOUP_PARSER)
+
+
+def _css(tree, sel):
+    return tree.css(sel) if _USE_SELECTOLAX else tree.select(sel)
+
+
+def _css_first(tree, sel):
+    return tree.css_first(sel) if _USE_SELECTOLAX else tree.select_one(sel)
+
+
+def _attr(node, name):
+    return node.attributes.get(name) if _USE_SELECTOLAX else node.get(name)
+
+
+def _text(node):
+    return node.text(strip=True) if _USE_SELECTOLAX else node.text.strip()
+
+
+def _classes(node):
+    if _USE_SELECTOLAX:
+        return (node.attributes.get('class') or '').split()
+    return node.get('class') or []
+
+# Compiled once; both run for every discovered file
+_EXT_RE = re.compile(r'\.([a-zA-Z0-9]+)$')
+_SANITIZE_RE = re.compile(r'[<>:"/\\|?*]')
+
+# Selectors of the shape "a.some-class" can be folded into the single
+# anchor pass in download_files_from_page instead of a second scan
+_SIMPLE_CLASS_RE = re.compile(r'^a\.([\w-]+)$')
+
+# Folders already created in this process; skips the makedirs stat when the
+# same thread folders come up again
+_DIRS_MADE = set()
+
+
+def _ensure_dir(path):
+    if path not in _DIRS_MADE:
+        os.makedirs(path, exist_ok=True)
+        _DIRS_MADE.add(path)
+
+
+# The hash only has to be unique on disk, so the fastest available
+# non-cryptographic digest wins; xxhash is optional
+try:
+    import xxhash
+
+    def _hash_url(url_bytes):
+        return xxhash.xxh3_128_hexdigest(url_bytes)
+except ImportError:
+    def _hash_url(url_bytes):
+        # 12 bytes (24 hex chars) is plenty to avoid collisions within a
+        # thread while keeping file names short
+        return hashlib.blake2b(url_bytes, digest_size=12).hexdigest()
+
+
+# Legacy Bunkr domains are probed per link, so a frozenset keeps the
+# membership test O(1); the first new domain is the rewrite target
+_LEGACY_BUNKR_DOMAINS = frozenset({
+    "bunkr.ax", "bunkr.cat", "bunkr.ru", "bunkrr.ru", "bunkr.su", "bunkrr.su",
+    "bunkr.la", "bunkr.is", "bunkr.to"
+})
+_NEW_BUNKR_DOMAINS = (
+    "bunkr.ac", "bunkr.ci", "bunkr.cr", "bunkr.fi", "bunkr.ph", "bunkr.pk",
+    "bunkr.ps", "bunkr.si", "bunkr.sk", "bunkr.ws", "bunkr.black", "bunkr.red",
+    "bunkr.media", "bunkr.site"
+)
+
+
+@lru_cache(maxsize=4096)
+def _convert_bunkr(url):
+    # The same external link appears on many pages of a thread; memoizing
+    # skips the repeated urlparse and rebuild
+    parsed_url = urlparse(url)
+    if parsed_url.netloc.lower() in _LEGACY_BUNKR_DOMAINS:
+        return parsed_url._replace(netloc=_NEW_BUNKR_DOMAINS[0]).geturl()
+    return url
+
+
+@lru_cache(maxsize=8192)
+def _hashed_name(file_url):
+    # The same URL is often rediscovered by several selectors on one page
+    return _hash_url(file_url.encode())
+
+
+try:
+    import orjson
+
+    def _parse_json(data):
+        return orjson.loads(data)
+except ImportError:
+    def _parse_json(data):
+        return json.loads(data)
+
+
+@lru_cache(maxsize=8)
+def _load_json(path, mtime):
+    # mtime is part of the key so edits to the config files are picked up
+    # while repeated instantiations reuse the parsed result
+    return _parse_json(Path(path).read_bytes())
+
 class Phica:
+    # Extension buckets used to route downloads into the image/video folders;
+    # frozensets make the membership tests O(1)
+    _IMG_EXT = frozenset({'jpg', 'jpeg', 'png', 'gif', 'webp'})
+    _VID_EXT = frozenset({'mp4', 'webm', 'mov', 'avi'})
+
     def __init__(self, download_folder, max_workers=5, log_callback=None, enable_widgets_callback=None, update_progress_callback=None, update_global_progress_callback=None, tr=None):
         self.download_folder = download_folder
         self.max_workers = max_workers
         self.descargadas = set()
+        self._img_existing = set()
+        self._video_existing = set()
+        # Guards concurrent updates to the existence sets from the workers
+        self._existing_lock = threading.Lock()
+        # Maps ETag -> file path so renamed URLs are not re-downloaded;
+        # persisted per thread folder in .etags.json
+        self._etag_index = {}
+        self._etag_path = None
+        # URL hashes already written to disk, persisted per thread folder so
+        # restarts skip finished files without touching the filesystem
+        self._manifest_path = None
+        self._manifest_dirty = 0
         self.log_callback = log_callback
         self.enable_widgets_callback = enable_widgets_callback
         self.update_progress_callback = update_progress_callback
@@ -32,10 +175,32 @@ class Phica:
         self.cancel_requested = False
         self.total_files = 0
         self.completed_files = 0
-        self.download_queue = queue.Queue()
+        # Single-producer bookkeeping only, so a lock-free deque suffices
+        self.download_queue = deque()
+        # Attachments are submitted here so several files transfer at once
+        # instead of each one waiting for the previous write to finish
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        # Page prefetches get their own worker so the next page is never
+        # stuck in line behind queued file downloads
+        self._page_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='phica-page')
+        self._futures = []
+        # Backpressure bound: long threads stop queueing once this many
+        # downloads are in flight, like an async semaphore would
+        self._max_pending = max_workers * 8
         self.tr = tr
-        self.external_links = []
+        self._external_seen = set()
+        self.seen_urls = set()
+        # Bucketed by host at insertion so the downstream downloaders can
+        # iterate their own links without rescanning a mixed list
+        self._bunkr_links = set()
+        self._gofile_links = set()
+        self._pixeldrain_links = set()
         self.translations = {}
+        # Log lines are batched and flushed on a short timer so chatty
+        # per-file messages do not flood the UI callback
+        self._log_buffer = deque()
+        self._log_lock = threading.Lock()
+        self._log_timer = None
 
         # Initialize cloudscraper
         self.scraper = cloudscraper.create_scraper()
@@ -44,43 +209,86 @@ class Phica:
         self.cookies = self.load_cookies("cookies_phica.json")
         self.handlers = self.load_handlers("handlers.json")
 
+        # Resolve the selector strings once instead of a handlers dict
+        # lookup per page
+        self._sel_title = self.handlers.get("thread_title", "h1.p-title-value")
+        self._sel_attach = self.handlers.get("attachments_selector", "a.file-preview")
+        self._sel_next = self.handlers.get("next_page_selector", "a.pageNav-jump--next")
+        self._sel_lightbox = 'a.js-lbImage'
+        # Attachment selectors are normally "a.file-preview"-shaped; when
+        # they are, the class is matched inline during the single anchor
+        # pass and no dedicated selector query is needed
+        attach_match = _SIMPLE_CLASS_RE.match(self._sel_attach)
+        self._attach_class = attach_match.group(1) if attach_match else None
+        self._lightbox_class = 'js-lbImage'
+
+        # All page and attachment requests go through the cloudscraper
+        # session: it is a requests.Session subclass, so it pools keep-alive
+        # connections the same way, and routing everything through it means
+        # every request carries the Cloudflare clearance tokens instead of
+        # only the ones that happened to use the scraper. Its adapters are
+        # left untouched: cloudscraper mounts a TLS-fingerprinting adapter
+        # that a plain HTTPAdapter would silently replace
+        self.session = self.scraper
+        # Transient failures (rate limits, gateway hiccups) are retried at
+        # the transport layer with exponential backoff instead of surfacing
+        # as a failed file; assigned onto the scraper's existing adapters so
+        # its TLS-fingerprinting setup stays intact
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            respect_retry_after_header=True,
+        )
+        for adapter in self.session.adapters.values():
+            adapter.max_retries = retry
+        self.session.cookies.update(self.cookies)
+        # XenForo compresses HTML when asked; requests decodes br/zstd
+        # automatically once brotli/zstandard are installed
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36',
+            'Accept-Encoding': 'gzip, br, zstd',
+            'Connection': 'keep-alive',
+        })
+
         # Check if cookies are missing or invalid
         if not self.cookies or not self.are_cookies_valid("https://www.phica.eu/forums/watched/threads"):  # Replace with a protected URL
             self.log(self.tr("Cookies are missing or invalid. Starting login process..."))
             self.login_and_store_cookies(login_url="https://www.phica.eu/forums/login")  # Replace with the login URL
             self.cookies = self.load_cookies("cookies_phica.json")  # Reload cookies after login
+            self.session.cookies.update(self.cookies)
 
-        # Load legacy and new Bunkr domains
-        self.legacy_bunkr_domains = [
-            "bunkr.ax", "bunkr.cat", "bunkr.ru", "bunkrr.ru", "bunkr.su", "bunkrr.su",
-            "bunkr.la", "bunkr.is", "bunkr.to"
-        ]
-        self.new_bunkr_domains = [
-            "bunkr.ac", "bunkr.ci", "bunkr.cr", "bunkr.fi", "bunkr.ph", "bunkr.pk",
-            "bunkr.ps", "bunkr.si", "bunkr.sk", "bunkr.ws", "bunkr.black", "bunkr.red",
-            "bunkr.media", "bunkr.site"
-        ]
+        # Kept as attributes for callers that inspect them; conversion
+        # itself goes through the memoized module-level helper
+        self.legacy_bunkr_domains = _LEGACY_BUNKR_DOMAINS
+        self.new_bunkr_domains = _NEW_BUNKR_DOMAINS
 
     def convert_legacy_bunkr_link(self, url):
         """
         Converts a legacy Bunkr domain URL to a new Bunkr domain URL.
         """
-        parsed_url = urlparse(url)
-        domain = parsed_url.netloc.lower()
-
-        # Check if the domain is a legacy Bunkr domain
-        if domain in self.legacy_bunkr_domains:
-            # Replace the legacy domain with a new domain (e.g., bunkr.si)
-            new_domain = self.new_bunkr_domains[0]  # Use the first new domain as default
-            new_url = parsed_url._replace(netloc=new_domain).geturl()
+        new_url = _convert_bunkr(url)
+        if new_url != url:
             self.log(self.tr(f"Converted legacy Bunkr link: {url} -> {new_url}"))
-            return new_url
-
-        # If the domain is not a legacy Bunkr domain, return the original URL
-        return url
+        return new_url
     def log(self, message):
-        if self.log_callback:
-            self.log_callback(message)
+        if self.log_callback is None:
+            return
+        with self._log_lock:
+            self._log_buffer.append(message)
+            if self._log_timer is None:
+                self._log_timer = threading.Timer(0.1, self._flush_logs)
+                self._log_timer.daemon = True
+                self._log_timer.start()
+
+    def _flush_logs(self):
+        with self._log_lock:
+            self._log_timer = None
+            if not self._log_buffer:
+                return
+            batch = "\n".join(self._log_buffer)
+            self._log_buffer.clear()
+        self.log_callback(batch)
 
     def load_cookies(self, file_name):
         """
@@ -92,11 +300,9 @@ class Phica:
         
         # Check if the file exists and load it
         if os.path.exists(full_path):
-            with open(full_path, 'r') as file:
-                cookies_list = json.load(file)
-                # Convert list of cookies to a dictionary
-                cookies_dict = {cookie['name']: cookie['value'] for cookie in cookies_list}
-                return cookies_dict
+            cookies_list = _load_json(full_path, os.path.getmtime(full_path))
+            # Convert list of cookies to a dictionary
+            return {cookie['name']: cookie['value'] for cookie in cookies_list}
         return {}
         
     def are_cookies_valid(self, test_url):
@@ -110,7 +316,8 @@ class Phica:
             bool: True if cookies are valid, False otherwise.
         """
         try:
-            response = self.scraper.get(test_url, cookies=self.cookies)
+            # The pooled session already carries the cookies
+            response = self.session.get(test_url)
             # If the response status code is 200 and the page contains user-specific content,
             # the cookies are valid.
             if response.status_code == 200:
@@ -120,14 +327,68 @@ class Phica:
             self.log(self.tr(f"Error checking cookie validity: {e}"))
         return False
 
+    def _http_login(self, login_url, username, password, cookie_file):
+        """
+        Logs in directly over HTTP with the given credentials and stores the
+        session cookies, skipping the browser round trip entirely.
+
+        Returns:
+            bool: True if the login succeeded and cookies were saved.
+        """
+        try:
+            # Fetch the login form to obtain the XenForo CSRF token
+            page = _parse_page(self.scraper.get(login_url).content)
+            token_input = _css_first(page, 'input[name="_xfToken"]')
+            if token_input is None:
+                return False
+
+            response = self.scraper.post(login_url + "/login", data={
+                'login': username,
+                'password': password,
+                '_xfToken': _attr(token_input, 'value'),
+                'remember': '1',
+            })
+            response.raise_for_status()
+            # XenForo sets the persistent user cookie only on success
+            if not any('user' in name for name in self.scraper.cookies.keys()):
+                return False
+
+            # Save cookies in the same format the Selenium flow produces
+            cookies = [
+                {'name': c.name, 'value': c.value, 'domain': c.domain}
+                for c in self.scraper.cookies
+            ]
+            config_folder = os.path.join("resources", "config")
+            os.makedirs(config_folder, exist_ok=True)
+            cookie_file_path = os.path.join(config_folder, cookie_file)
+            with open(cookie_file_path, "w") as f:
+                json.dump(cookies, f)
+            self.log(self.tr(f"Cookies saved to {cookie_file_path}"))
+            return True
+        except requests.RequestException as e:
+            self.log(self.tr(f"Error during login: {e}"))
+            return False
+
     def login_and_store_cookies(self, login_url, cookie_file="cookies_phica.json"):
         """
         Automates the login process and stores cookies after the user logs in.
-        
+
+        When PHICA_USERNAME and PHICA_PASSWORD are set in the environment the
+        login is performed over HTTP without opening a browser; the manual
+        Selenium flow remains the fallback.
+
         Args:
             login_url (str): The URL of the login page.
             cookie_file (str): The file to store the cookies in.
         """
+        username = os.environ.get("PHICA_USERNAME")
+        password = os.environ.get("PHICA_PASSWORD")
+        if username and password:
+            self.log(self.tr("Logging in with stored credentials..."))
+            if self._http_login(login_url, username, password, cookie_file):
+                return
+            self.log(self.tr("Credential login failed, falling back to browser login..."))
+
         # Initialize the Selenium WebDriver (e.g., Chrome)
         options = webdriver.ChromeOptions()
         # Remove the --headless argument to show the browser window
@@ -181,20 +442,23 @@ class Phica:
         
         # Check if the file exists and load it
         if os.path.exists(full_path):
-            with open(full_path, 'r') as file:
-                return json.load(file)
+            return _load_json(full_path, os.path.getmtime(full_path))
         else:
             print(f"Handlers file not found: {full_path}")  # Debugging
             return {}
 
     def sanitize_folder_name(self, name):
-        return re.sub(r'[<>:"/\\|?*]', '_', name)
+        return _SANITIZE_RE.sub('_', name)
 
     def request_cancel(self):
         """
         Sets the cancel flag to stop ongoing downloads.
         """
         self.cancel_requested = True
+        # Pending (not yet started) downloads are dropped outright; running
+        # ones notice the flag at their next chunk boundary
+        for future in self._futures:
+            future.cancel()
         self.log(self.tr("Descarga cancelada por el usuario."))
 
     def download_files(self, link):
@@ -202,12 +466,23 @@ class Phica:
             # Reset cancel flag at the start of a new download
             self.cancel_requested = False
 
+            # Per-run discovery state: on a reused instance the previous
+            # thread's URLs must not count as already dispatched, nor its
+            # external links be re-sent into this thread's folder (the
+            # existence sets below are re-snapshotted per run for the same
+            # reason)
+            self.seen_urls.clear()
+            self._external_seen.clear()
+            self._bunkr_links.clear()
+            self._gofile_links.clear()
+            self._pixeldrain_links.clear()
+
             # Fetch the page content
-            response = requests.get(link, cookies=self.cookies)
+            response = self.session.get(link)
             response.raise_for_status()
 
-            # Parse the page content
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # Parse the page content (bytes, so the C parsers skip a decode pass)
+            soup = _parse_page(response.content)
 
             # Extract the thread title
             thread_title = self.extract_thread_title(soup)
@@ -218,26 +493,74 @@ class Phica:
             # Create a folder for the thread
             folder_name = self.sanitize_folder_name(thread_title)
             download_folder = os.path.join(self.download_folder, folder_name)
-            os.makedirs(download_folder, exist_ok=True)
+            _ensure_dir(download_folder)
 
             # Create separate folders for images and videos
             img_folder = os.path.join(download_folder, "img")
             video_folder = os.path.join(download_folder, "videos")
-            os.makedirs(img_folder, exist_ok=True)
-            os.makedirs(video_folder, exist_ok=True)
+            _ensure_dir(img_folder)
+            _ensure_dir(video_folder)
+
+            # Snapshot both folders once so resuming a thread costs two
+            # directory scans instead of a stat call per file; kept
+            # separate so a name is only matched against its own folder.
+            # scandir streams entries without building the intermediate list
+            # that listdir would
+            with os.scandir(img_folder) as entries:
+                self._img_existing = {entry.name for entry in entries}
+            with os.scandir(video_folder) as entries:
+                self._video_existing = {entry.name for entry in entries}
+
+            self._etag_path = os.path.join(download_folder, ".etags.json")
+            try:
+                with open(self._etag_path, 'r', encoding='utf-8') as f:
+                    self._etag_index = json.load(f)
+            except (OSError, ValueError):
+                self._etag_index = {}
+
+            self._manifest_path = os.path.join(download_folder, ".phica_downloaded.json")
+            try:
+                with open(self._manifest_path, 'r', encoding='utf-8') as f:
+                    self.descargadas = set(json.load(f))
+            except (OSError, ValueError):
+                self.descargadas = set()
+
+            # Kick off the next-page fetch before walking the current page
+            # so its network latency hides behind extraction and downloads
+            next_page_url = self.extract_next_page_url(soup)
+            prefetch = None
+            if next_page_url:
+                self.log(self.tr(f"Found next page: {next_page_url}"))
+                prefetch = self._page_pool.submit(self._fetch_and_parse, next_page_url)
 
             # Download files from the current page
             self.download_files_from_page(soup, img_folder, video_folder)
 
             # Handle pagination (if there are multiple pages)
-            next_page_url = self.extract_next_page_url(soup)
-            while next_page_url and not self.cancel_requested:
-                self.log(self.tr(f"Found next page: {next_page_url}"))
-                response = requests.get(next_page_url, cookies=self.cookies)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.text, 'html.parser')
-                self.download_files_from_page(soup, img_folder, video_folder)
+            while prefetch is not None and not self.cancel_requested:
+                soup = prefetch.result()
                 next_page_url = self.extract_next_page_url(soup)
+                prefetch = None
+                if next_page_url:
+                    self.log(self.tr(f"Found next page: {next_page_url}"))
+                    prefetch = self._page_pool.submit(self._fetch_and_parse, next_page_url)
+                self.download_files_from_page(soup, img_folder, video_folder)
+
+            # Let the queued attachment downloads drain before moving on to
+            # the external hosts; results are retrieved so failures outside
+            # download_file's own RequestException handler (disk errors,
+            # malformed headers) surface in the log instead of vanishing
+            if self._futures:
+                for future in as_completed(self._futures):
+                    if future.cancelled():
+                        continue
+                    try:
+                        future.result()
+                    except Exception as e:
+                        self.log(self.tr(f"Download task failed: {e}"))
+                self._futures.clear()
+            self._save_etag_index()
+            self._save_manifest()
 
             # After downloading all files from the thread, download external files
             self.download_external_files(download_folder)
@@ -245,76 +568,117 @@ class Phica:
         except requests.RequestException as e:
             self.log(self.tr(f"Error fetching the page: {e}"))
 
+    def _submit_download(self, file_url, img_folder, video_folder):
+        """
+        Queues a file download, blocking briefly when too many transfers are
+        already pending so huge threads do not pile up futures unboundedly.
+        The same URL is only ever dispatched once per run: attachments and
+        lightbox links frequently point at the same media.
+        """
+        if file_url in self.seen_urls:
+            return
+        self.seen_urls.add(file_url)
+        if len(self._futures) >= self._max_pending:
+            done, not_done = wait(self._futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.cancelled():
+                    continue
+                try:
+                    future.result()
+                except Exception as e:
+                    self.log(self.tr(f"Download task failed: {e}"))
+            self._futures = list(not_done)
+        self._futures.append(self.executor.submit(self.download_file, file_url, img_folder, video_folder))
+
     def extract_thread_title(self, soup):
         # Example: Find the thread title in the page content
         # Adjust the selector based on the actual page structure
-        title_tag = soup.select_one(self.handlers.get("thread_title", "h1.p-title-value"))
+        title_tag = _css_first(soup, self._sel_title)
         if title_tag:
-            return title_tag.text.strip()
+            return _text(title_tag)
         return None
 
     def download_files_from_page(self, soup, img_folder, video_folder):
-        # Existing code to find video tags, file links, and lightbox links...
-
-        # Find external links (Bunkr, Gofile, Pixeldrain, etc.)
-        external_links = soup.find_all('a', href=True)
-        for link in external_links:
-            href = link['href']
-            if any(domain in href for domain in ["bunkr", "bunkrr", "gofile", "pixeldrain"]):  # Add "bunkrr" to the list
-                # Convert legacy Bunkr links to new domains
-                converted_link = self.convert_legacy_bunkr_link(href)
-                self.external_links.append(converted_link)
-                self.log(self.tr(f"Found external link: {converted_link}"))
-
-        # Find all <a> tags with the file URL (attachments)
-        file_links = soup.select(self.handlers.get("attachments_selector", "a.file-preview"))
-        for file_link in file_links:
+        # A single pass over every anchor replaces the three selector scans
+        # (external hosts, attachments, lightbox images) this used to run
+        for link in _css(soup, 'a[href]'):
             if self.cancel_requested:
                 break  # Stop processing if cancel is requested
 
-            # Extract the relative file URL from the href attribute
-            relative_file_url = file_link['href']
-            # Construct the full file URL
-            full_file_url = urljoin(self.base_url, relative_file_url)
-            self.log(self.tr(f"Found file URL (a tag): {full_file_url}"))
-            self.download_file(full_file_url, img_folder, video_folder)
-
-        # Find all <a> tags with the class 'js-lbImage' (lightbox images)
-        lightbox_links = soup.select('a.js-lbImage')
-        for link in lightbox_links:
-            if self.cancel_requested:
-                break  # Stop processing if cancel is requested
+            href = _attr(link, 'href')
+            if not href:
+                continue
 
-            # Extract the file URL from the href attribute
-            file_url = link.get('href')
-            if file_url:
-                full_file_url = urljoin(self.base_url, file_url)
+            # External links (Bunkr, Gofile, Pixeldrain, etc.), deduplicated
+            # at insertion so downstream consumers never rescan duplicates;
+            # "bunkrr" is covered by the "bunkr" substring
+            if 'bunkr' in href or 'gofile' in href or 'pixeldrain' in href:
+                # Convert legacy Bunkr links to new domains
+                converted_link = self.convert_legacy_bunkr_link(href)
+                if converted_link not in self._external_seen:
+                    self._external_seen.add(converted_link)
+                    if 'gofile' in converted_link:
+                        self._gofile_links.add(converted_link)
+                    elif 'pixeldrain' in converted_link:
+                        self._pixeldrain_links.add(converted_link)
+                    else:
+                        self._bunkr_links.add(converted_link)
+                    self.log(self.tr(f"Found external link: {converted_link}"))
+                continue
+
+            classes = _classes(link)
+            if self._attach_class is not None and self._attach_class in classes:
+                # Attachment link
+                full_file_url = self._join(href)
+                self.log(self.tr(f"Found file URL (a tag): {full_file_url}"))
+                self._submit_download(full_file_url, img_folder, video_folder)
+            elif self._lightbox_class in classes:
+                # Lightbox image
+                full_file_url = self._join(href)
                 self.log(self.tr(f"Found file URL (lightbox link): {full_file_url}"))
-                self.download_file(full_file_url, img_folder, video_folder)
+                self._submit_download(full_file_url, img_folder, video_folder)
 
-        # Find external links (Bunkr, Gofile, Pixeldrain, etc.)
-        external_links = soup.find_all('a', href=True)
-        for link in external_links:
-            href = link['href']
-            if any(domain in href for domain in ["bunkr", "bunkrr", "gofile", "pixeldrain"]):  # Add "bunkrr" to the list
-                self.external_links.append(href)
-                self.log(self.tr(f"Found external link: {href}"))
+        if self._attach_class is None:
+            # The handler configured a selector too complex to match inline;
+            # keep the dedicated attachment query for that case
+            for file_link in _css(soup, self._sel_attach):
+                if self.cancel_requested:
+                    break  # Stop processing if cancel is requested
+
+                relative_file_url = _attr(file_link, 'href')
+                full_file_url = self._join(relative_file_url)
+                self.log(self.tr(f"Found file URL (a tag): {full_file_url}"))
+                self._submit_download(full_file_url, img_folder, video_folder)
+
+    def _fetch_and_parse(self, url):
+        """
+        Fetches and parses a thread page; runs on the executor so the next
+        page is ready by the time the current one has been processed.
+        """
+        response = self.session.get(url)
+        response.raise_for_status()
+        return _parse_page(response.content)
 
     def extract_next_page_url(self, soup):
         # Find the "Next Page" link
-        next_page_link = soup.select_one(self.handlers.get("next_page_selector", "a.pageNav-jump--next"))
+        next_page_link = _css_first(soup, self._sel_next)
         if next_page_link:
-            return urljoin(self.base_url, next_page_link['href'])
+            return self._join(_attr(next_page_link, 'href'))
         return None
 
     def generate_unique_file_name(self, file_url):
         """
         Generates a unique but fixed file name based on the file URL.
         """
-        # Create a hash of the file URL to generate a unique but fixed name
-        file_hash = hashlib.md5(file_url.encode()).hexdigest()
+        return self._name_and_ext(file_url)[0]
+
+    def _name_and_ext(self, file_url):
+        """
+        Resolves the hashed on-disk name and the extension in one pass so
+        download_file does not parse the URL twice.
+        """
         file_extension = self.get_file_extension(file_url)
-        return f"{file_hash}.{file_extension}"
+        return f"{_hashed_name(file_url)}.{file_extension}", file_extension
 
     def download_file(self, file_url, img_folder, video_folder):
         try:
@@ -322,61 +686,157 @@ class Phica:
                 return  # Skip downloading if cancel is requested
 
             # Generate a unique but fixed file name
-            file_name = self.generate_unique_file_name(file_url)
+            file_name, file_extension = self._name_and_ext(file_url)
+
+            # The persisted manifest answers "already downloaded" without
+            # any filesystem or network round trip
+            if file_name in self.descargadas:
+                return
 
             # Determine if the file is an image or video based on the extension
-            file_extension = self.get_file_extension(file_url)
-            if file_extension in ["jpg", "jpeg", "png", "gif", "webp"]:
-                target_folder = img_folder
-            elif file_extension in ["mp4", "webm", "mov", "avi"]:
-                target_folder = video_folder
+            if file_extension in self._IMG_EXT:
+                target_folder, existing = img_folder, self._img_existing
+            elif file_extension in self._VID_EXT:
+                target_folder, existing = video_folder, self._video_existing
             else:
-                target_folder = img_folder  # Default to images folder for unknown types
+                # Default to images folder for unknown types
+                target_folder, existing = img_folder, self._img_existing
 
-            # Check if the file already exists
             file_path = os.path.join(target_folder, file_name)
-            if os.path.exists(file_path):
-                self.log(self.tr(f"File already exists, skipping: {file_name}"))
-                return
 
-            # Fetch the file content with cookies
-            response = requests.get(file_url, cookies=self.cookies, stream=True)
+            # A cheap HEAD yields the ETag and size: files already indexed
+            # under the ETag are skipped outright, and partially written
+            # files only fetch the missing tail via a Range request
+            head = self.session.head(file_url, allow_redirects=True)
+            etag = head.headers.get('ETag')
+            if etag and etag in self._etag_index:
+                # .etags.json outlives the media: only honor the index entry
+                # while the file it points at is still on disk, so deleting
+                # files re-downloads them instead of hitting a permanent skip
+                if os.path.exists(self._etag_index[etag]):
+                    self.log(self.tr(f"File already downloaded (ETag match), skipping: {file_name}"))
+                    return
+                del self._etag_index[etag]
+            content_length = int(head.headers.get('Content-Length', 0))
+
+            req_headers = None
+            mode = 'wb'
+            if file_name in existing:
+                existing_size = os.path.getsize(file_path) if os.path.exists(file_path) else 0
+                if content_length and 0 < existing_size < content_length:
+                    req_headers = {'Range': f'bytes={existing_size}-'}
+                    mode = 'ab'
+                else:
+                    self.log(self.tr(f"File already exists, skipping: {file_name}"))
+                    return
+
+            # Fetch the file content; the session already carries the cookies
+            response = self.session.get(file_url, stream=True, headers=req_headers)
             response.raise_for_status()
-
-            # Save the file to the folder
-            with open(file_path, 'wb') as file:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if self.cancel_requested:
-                        break  # Stop downloading if cancel is requested
-                    file.write(chunk)
+            if mode == 'ab' and response.status_code != 206:
+                mode = 'wb'  # Server ignored the Range request
+
+            # Save the file in 1 MiB reads so the copy loop stays mostly in
+            # C while the cancel flag is still checked every megabyte
+            response.raw.decode_content = True
+            with open(file_path, mode, buffering=1 << 20) as file:
+                if mode == 'wb' and content_length and hasattr(os, 'posix_fallocate'):
+                    # Reserving the final size up front avoids incremental
+                    # extent allocation and fragmentation on large videos
+                    try:
+                        os.posix_fallocate(file.fileno(), 0, content_length)
+                    except OSError:
+                        pass  # Not supported by this filesystem
+                read = response.raw.read
+                write = file.write
+                try:
+                    while not self.cancel_requested:
+                        chunk = read(1 << 20)
+                        if not chunk:
+                            break
+                        write(chunk)
+                finally:
+                    if mode == 'wb' and content_length:
+                        # Trim the preallocated tail to the bytes actually
+                        # written — also when the transfer dies mid-stream,
+                        # so an aborted download leaves a short file the
+                        # Range resume can finish instead of a zero-padded
+                        # one that passes the size check as complete
+                        file.truncate()
 
             if not self.cancel_requested:
+                # The file is never read back; keep it out of the page cache
+                _drop_page_cache(file_path)
                 self.log(self.tr(f"File downloaded successfully: {file_path}"))
-                self.descargadas.add(file_name)  # Add the file name to the set of downloaded files
+                with self._existing_lock:
+                    self.descargadas.add(file_name)  # Add the file name to the set of downloaded files
+                    existing.add(file_name)
+                if etag:
+                    self._etag_index[etag] = file_path
+                # Debounced persistence: flush every 50 files and at thread end
+                self._manifest_dirty += 1
+                if self._manifest_dirty >= 50:
+                    self._save_manifest()
         except requests.RequestException as e:
             self.log(self.tr(f"Error downloading the file: {e}"))
 
+    def _save_etag_index(self):
+        if not self._etag_path:
+            return
+        try:
+            with open(self._etag_path, 'w', encoding='utf-8') as f:
+                json.dump(self._etag_index, f)
+        except OSError:
+            pass
+
+    def _save_manifest(self):
+        if not self._manifest_path:
+            return
+        self._manifest_dirty = 0
+        try:
+            with open(self._manifest_path, 'w', encoding='utf-8') as f:
+                json.dump(sorted(self.descargadas), f)
+        except OSError:
+            pass
+
     def get_file_extension(self, url):
         # Extract the file extension from the URL
         parsed_url = urlparse(url)
         path = parsed_url.path
         # Match the file extension (e.g., jpg, png, etc.)
-        match = re.search(r'\.([a-zA-Z0-9]+)$', path)
+        match = _EXT_RE.search(path)
         if match:
             return match.group(1).lower()
         return "jpg"  # Default to .jpg if no extension is found
 
+    def _join(self, rel):
+        """
+        Resolves a link against the thread's base URL. The base is fixed per
+        thread, so the common prefixes are handled with plain concatenation
+        and only odd relative paths pay for a full urljoin parse.
+        """
+        if rel.startswith(('http://', 'https://')):
+            return rel
+        if rel.startswith('//'):
+            return f"{self._scheme}:{rel}"
+        if rel.startswith('/'):
+            return self._origin + rel
+        return urljoin(self.base_url, rel)
+
     def download_images_from_phica(self, url):
         self.base_url = url  # Set the base URL for the thread
+        parsed = urlparse(url)
+        self._scheme = parsed.scheme
+        self._origin = f"{parsed.scheme}://{parsed.netloc}"
         self.log(self.tr(f"Procesando hilo: {url}"))
         self.download_files(url)
         self.log(self.tr("Descarga completada."))
 
     def download_gofile_files(self, download_folder):
         """
-        Download files from Gofile links sequentially and avoid duplicates.
+        Download files from Gofile links and avoid duplicates.
         """
-        if not self.external_links:
+        if not self._gofile_links:
             return
 
         self.log(self.tr("Starting download of Gofile files..."))
@@ -389,18 +849,13 @@ class Phica:
             update_progress_callback=self.update_progress_callback,
             update_global_progress_callback=self.update_global_progress_callback,
             headers=None,
-            max_workers=1,  # Set max_workers to 1 for sequential downloads
+            max_workers=min(self.max_workers, 4),  # Gofile throttles aggressive clients
             tr=self.tr  # Pass the translation function as 'tr'
         )
 
-        # Deduplicate Gofile links
-        unique_gofile_links = set()
-        for link in self.external_links:
-            if "gofile" in link:
-                unique_gofile_links.add(link)
-
-        # Process Gofile links sequentially
-        for link in unique_gofile_links:
+        # Albums are processed one at a time (files within each download in
+        # parallel); the bucket is already deduplicated
+        for link in self._gofile_links:
             if self.cancel_requested:
                 break  # Stop processing if cancel is requested
             gofile_downloader.descargar_gofile(link)
@@ -411,34 +866,35 @@ class Phica:
         """
         Download files from external links (Bunkr, Gofile, Pixeldrain, etc.)
         """
-        if not self.external_links:
+        if not (self._bunkr_links or self._gofile_links or self._pixeldrain_links):
             return
 
         self.log(self.tr("Starting download of external files..."))
 
-        # Initialize the Bunkr downloader
-        bunkr_downloader = BunkrDownloader(
-            download_folder=download_folder,
-            log_callback=self.log_callback,
-            enable_widgets_callback=self.enable_widgets_callback,
-            update_progress_callback=self.update_progress_callback,
-            update_global_progress_callback=self.update_global_progress_callback,
-            headers=None,
-            max_workers=self.max_workers,
-            translations=self.translations,  # Pass the translations dictionary
-            tr=self.tr  # Pass the translation function explicitly
-        )
-
-        # Initialize the Gofile downloader
         self.download_gofile_files(download_folder)
 
-        for link in self.external_links:
-            if "bunkr" in link:
-                # Convert legacy Bunkr links to new domains
-                converted_link = self.convert_legacy_bunkr_link(link)
-                bunkr_downloader.descargar_post_bunkr(converted_link)
-            elif "pixeldrain" in link:
-                # Implement Pixeldrain downloader here
-                pass
+        if self._bunkr_links:
+            # Initialize the Bunkr downloader only when there is work for it
+            bunkr_downloader = BunkrDownloader(
+                download_folder=download_folder,
+                log_callback=self.log_callback,
+                enable_widgets_callback=self.enable_widgets_callback,
+                update_progress_callback=self.update_progress_callback,
+                update_global_progress_callback=self.update_global_progress_callback,
+                headers=None,
+                max_workers=self.max_workers,
+                translations=self.translations,  # Pass the translations dictionary
+                tr=self.tr  # Pass the translation function explicitly
+            )
+            # Legacy domains were already converted when the links were found.
+            # Posts are fetched concurrently; the per-host semaphore inside
+            # BunkrDownloader keeps any single host from being hammered
+            post_futures = [
+                self.executor.submit(bunkr_downloader.descargar_post_bunkr, link)
+                for link in self._bunkr_links
+            ]
+            wait(post_futures)
+
+        # Pixeldrain links in self._pixeldrain_links await a dedicated downloader
 
         self.log(self.tr("External files download completed."))
\ No newline at end of file